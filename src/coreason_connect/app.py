@@ -38,6 +38,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Initialize service
     service = CoreasonConnectServiceAsync(config=config)
+    # Load plugins before serving so a broken plugin shows up at startup, not on the first request
+    service.ensure_plugins_loaded()
 
     # Initialize transport
     # The endpoint path "/messages" informs the client where to post messages.
@@ -9,6 +9,7 @@
 # Source Code: https://github.com/CoReason-AI/coreason_connect
 
 import os
+from collections import Counter, OrderedDict
 from pathlib import Path
 from typing import Annotated, Any
 
@@ -17,6 +18,12 @@ from pydantic import BaseModel, BeforeValidator, Field, field_validator
 
 from coreason_connect.utils.logger import logger
 
+try:
+    # libyaml-backed loader is an order of magnitude faster when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 def force_str(v: Any) -> str:
     """Force conversion of a value to a string.
@@ -27,7 +34,8 @@ def force_str(v: Any) -> str:
     Returns:
         str: The string representation of the value.
     """
-    return str(v)
+    # Exact-type check: most values already arrive as plain strings
+    return v if type(v) is str else str(v)
 
 
 Stringified = Annotated[str, BeforeValidator(force_str)]
@@ -73,14 +81,14 @@ class PluginConfig(BaseModel):
         if v is None:
             return v
 
-        safe_zone = Path(os.getcwd()).resolve()
-        try:
-            # resolve() handles '..' and symlinks
-            target_path = Path(v).resolve()
-        except Exception as e:
-            raise ValueError(f"Invalid path resolution: {e}") from e
+        if "\x00" in v:
+            raise ValueError("Invalid path resolution: embedded null byte")
 
-        if not target_path.is_relative_to(safe_zone):
+        # Lexical check only (no filesystem access); the loader re-checks with
+        # resolve(), which also follows symlinks, before executing any plugin.
+        safe_zone = os.getcwd()
+        target_path = os.path.normpath(os.path.join(safe_zone, v))
+        if target_path != safe_zone and not target_path.startswith(safe_zone.rstrip(os.sep) + os.sep):
             raise ValueError(f"Plugin path must be within the safe zone ({safe_zone})")
 
         return v
@@ -91,9 +99,11 @@ class AppConfig(BaseModel):
 
     Attributes:
         plugins: List of configured plugins.
+        eager_load: Whether to instantiate plugins at server start-up instead of on first use.
     """
 
     plugins: list[PluginConfig] = Field(default_factory=list, description="List of configured plugins")
+    eager_load: bool = Field(False, description="Instantiate plugins at start-up instead of on first use")
 
     @field_validator("plugins")
     @classmethod
@@ -109,16 +119,40 @@ class AppConfig(BaseModel):
         Raises:
             ValueError: If duplicate plugin IDs are found.
         """
-        ids = [p.id for p in v]
-        if len(ids) != len(set(ids)):
-            duplicates = set([x for x in ids if ids.count(x) > 1])
-            raise ValueError(f"Duplicate plugin IDs found: {duplicates}")
-        return v
+        # Fast path: a single set pass settles the common no-duplicates case
+        seen: set[str] = set()
+        for p in v:
+            if p.id in seen:
+                break
+            seen.add(p.id)
+        else:
+            return v
+
+        counts = Counter(p.id for p in v)
+        # Report at most the 10 most common offenders to keep the error readable
+        duplicates = {plugin_id for plugin_id, count in counts.most_common(10) if count > 1}
+        raise ValueError(f"Duplicate plugin IDs found: {duplicates}")
+
+
+# Parsed configurations keyed by (resolved path, cwd) and stamped with the file's (mtime_ns, size).
+# The working directory is part of the key because plugin path validation is relative to it.
+_CONFIG_CACHE: OrderedDict[tuple[str, str], tuple[tuple[int, int], AppConfig]] = OrderedDict()
+_CONFIG_CACHE_MAX_ENTRIES = 100
+
+
+def clear_config_cache() -> None:
+    """Discard all memoized configurations so the next load re-reads from disk."""
+    _CONFIG_CACHE.clear()
 
 
 def load_config(config_path: str | Path | None = None) -> AppConfig:
     """Load the application configuration from a YAML file.
 
+    Results are memoized (LRU, up to 100 files) on the file's resolved path,
+    modification time and size, so repeated loads of an unchanged file skip
+    parsing and validation. Every call returns its own copy, so callers may
+    modify the result without affecting later loads.
+
     Args:
         config_path: Path to the configuration file. If None, checks the
             COREASON_CONFIG_PATH environment variable or defaults to
@@ -141,9 +175,24 @@ def load_config(config_path: str | Path | None = None) -> AppConfig:
         logger.error(f"Configuration file not found: {path_obj}")
         raise FileNotFoundError(f"Configuration file not found at {path_obj}")
 
+    cache_key: tuple[str, str] | None
     try:
-        with open(path_obj, "r", encoding="utf-8") as f:
-            raw_data = yaml.safe_load(f)
+        stat = path_obj.stat()
+        cache_key = (str(path_obj.resolve()), os.getcwd())
+        stamp = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        cache_key = None
+
+    if cache_key is not None:
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None and cached[0] == stamp:
+            _CONFIG_CACHE.move_to_end(cache_key)
+            logger.debug(f"Using cached configuration for {path_obj}")
+            return cached[1].model_copy(deep=True)
+
+    try:
+        # A single read hands libyaml one contiguous buffer
+        raw_data = yaml.load(path_obj.read_bytes(), Loader=_YamlLoader)
     except yaml.YAMLError as e:
         logger.error(f"Failed to parse YAML configuration: {e}")
         raise ValueError(f"Invalid YAML configuration: {e}") from e
@@ -158,8 +207,15 @@ def load_config(config_path: str | Path | None = None) -> AppConfig:
 
     try:
         config = AppConfig(**raw_data)
-        logger.info(f"Successfully loaded {len(config.plugins)} plugins")
-        return config
     except Exception as e:
         logger.error(f"Configuration validation failed: {e}")
         raise ValueError(f"Configuration validation failed: {e}") from e
+
+    logger.info(f"Successfully loaded {len(config.plugins)} plugins")
+    if cache_key is not None:
+        # Cache a private copy so the caller's instance can be modified freely
+        _CONFIG_CACHE[cache_key] = (stamp, config.model_copy(deep=True))
+        _CONFIG_CACHE.move_to_end(cache_key)
+        if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX_ENTRIES:
+            _CONFIG_CACHE.popitem(last=False)
+    return config
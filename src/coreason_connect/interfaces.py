@@ -58,6 +58,9 @@ class ConnectorProtocol(ABC):
     def __init__(self, secrets: SecretsProvider) -> None:
         """Inject vault access at initialization.
 
+        The plugin loader may call constructors on worker threads, which do not
+        see the caller's ``contextvars``; read request-scoped context in ``execute``.
+
         Args:
             secrets: The SecretsProvider instance to use for retrieving credentials.
         """
@@ -12,8 +12,10 @@ import importlib.util
 import inspect
 import os
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
+from types import ModuleType
 from typing import Generator
 
 from coreason_connect.config import AppConfig, PluginConfig
@@ -56,38 +58,90 @@ class PluginLoader:
     def load_all(self) -> dict[str, ConnectorProtocol]:
         """Load all configured plugins.
 
+        Plugin modules are imported one at a time because importing mutates
+        ``sys.path`` and ``sys.modules``; the connector constructors, which
+        typically build HTTP clients and read secrets, then run concurrently.
+        If worker threads cannot be started, the remaining constructors run in
+        the calling thread instead.
+
         Returns:
             dict[str, ConnectorProtocol]: A dictionary mapping plugin IDs to their
             ConnectorProtocol implementation instances.
         """
+        pending: list[tuple[PluginConfig, type[ConnectorProtocol]]] = []
         for plugin_conf in self.config.plugins:
             try:
                 if plugin_conf.type == "local_python":
-                    connector = self._load_local_python(plugin_conf)
-                    if connector:
-                        self.plugins[plugin_conf.id] = connector
-                        logger.info(f"Loaded plugin: {plugin_conf.id}")
+                    pending.append((plugin_conf, self._resolve_local_python(plugin_conf)))
                 elif plugin_conf.type == "native":
-                    connector = self._load_native(plugin_conf)
-                    if connector:
-                        self.plugins[plugin_conf.id] = connector
-                        logger.info(f"Loaded native plugin: {plugin_conf.id}")
+                    pending.append((plugin_conf, self._resolve_native(plugin_conf)))
                 else:
                     logger.warning(f"Unsupported plugin type '{plugin_conf.type}' for plugin '{plugin_conf.id}'")
             except Exception as e:
                 logger.error(f"Failed to load plugin '{plugin_conf.id}': {e}")
                 # We continue loading other plugins instead of crashing
 
+        if not pending:
+            return self.plugins
+
+        futures: list[Future[ConnectorProtocol]] = []
+        try:
+            with ThreadPoolExecutor(max_workers=min(32, len(pending))) as executor:
+                try:
+                    for _, connector_class in pending:
+                        futures.append(executor.submit(connector_class, self.secrets))
+                except RuntimeError:
+                    # Drop queued work that has not started so no connector is constructed twice
+                    executor.shutdown(cancel_futures=True)
+                    raise
+        except RuntimeError as e:
+            # Worker threads are unavailable (thread limit reached or interpreter shutting down)
+            logger.warning(f"Could not construct plugins on worker threads, constructing them in this thread: {e}")
+
+        # Collect in configuration order so registration stays deterministic
+        for index, (plugin_conf, connector_class) in enumerate(pending):
+            future = futures[index] if index < len(futures) else None
+            try:
+                if future is None or future.cancelled():
+                    self.plugins[plugin_conf.id] = connector_class(self.secrets)
+                else:
+                    self.plugins[plugin_conf.id] = future.result()
+            except Exception as e:
+                logger.error(f"Failed to load plugin '{plugin_conf.id}': {e}")
+                continue
+            kind = "native plugin" if plugin_conf.type == "native" else "plugin"
+            logger.info(f"Loaded {kind}: {plugin_conf.id}")
+
         return self.plugins
 
-    def _load_native(self, config: PluginConfig) -> ConnectorProtocol:
-        """Load a built-in native plugin.
+    @staticmethod
+    def _find_connector_class(module: ModuleType, source: str) -> type[ConnectorProtocol]:
+        """Find the ConnectorProtocol implementation defined in a module.
+
+        Args:
+            module: The imported plugin module.
+            source: Module name or path used in the error message.
+
+        Returns:
+            type[ConnectorProtocol]: The first ConnectorProtocol subclass found.
+
+        Raises:
+            ValueError: If the module does not contain a ConnectorProtocol implementation.
+        """
+        for _name, obj in inspect.getmembers(module, inspect.isclass):
+            # Check if it implements ConnectorProtocol but is not the abstract base class itself
+            if issubclass(obj, ConnectorProtocol) and obj is not ConnectorProtocol:
+                return obj
+        raise ValueError(f"No ConnectorProtocol implementation found in {source}")
+
+    def _resolve_native(self, config: PluginConfig) -> type[ConnectorProtocol]:
+        """Resolve the connector class of a built-in native plugin.
 
         Args:
             config: The configuration for the plugin.
 
         Returns:
-            ConnectorProtocol: An instance of the plugin's ConnectorProtocol implementation.
+            type[ConnectorProtocol]: The plugin's ConnectorProtocol implementation.
 
         Raises:
             ImportError: If the plugin module cannot be found.
@@ -102,26 +156,16 @@ class PluginLoader:
         except ImportError as e:
             raise ImportError(f"Native plugin module '{full_module_name}' not found: {e}") from e
 
-        # Find the ConnectorProtocol implementation
-        connector_class = None
-        for _name, obj in inspect.getmembers(module, inspect.isclass):
-            if issubclass(obj, ConnectorProtocol) and obj is not ConnectorProtocol:
-                connector_class = obj
-                break
-
-        if connector_class is None:
-            raise ValueError(f"No ConnectorProtocol implementation found in {full_module_name}")
-
-        return connector_class(self.secrets)
+        return self._find_connector_class(module, full_module_name)
 
-    def _load_local_python(self, config: PluginConfig) -> ConnectorProtocol:
-        """Load a local Python plugin from disk.
+    def _resolve_local_python(self, config: PluginConfig) -> type[ConnectorProtocol]:
+        """Import a local Python plugin from disk and resolve its connector class.
 
         Args:
             config: The configuration for the plugin.
 
         Returns:
-            ConnectorProtocol: An instance of the plugin's ConnectorProtocol implementation.
+            type[ConnectorProtocol]: The plugin's ConnectorProtocol implementation.
 
         Raises:
             ValueError: If the plugin configuration is invalid or the path is unsafe.
@@ -162,16 +206,4 @@ class PluginLoader:
                 del sys.modules[module_name]
             raise ImportError(f"Error executing module '{module_name}': {e}") from e
 
-        # Find the ConnectorProtocol implementation
-        connector_class = None
-        for _name, obj in inspect.getmembers(module, inspect.isclass):
-            # Check if it implements ConnectorProtocol but is not the abstract base class itself
-            if issubclass(obj, ConnectorProtocol) and obj is not ConnectorProtocol:
-                connector_class = obj
-                break
-
-        if connector_class is None:
-            raise ValueError(f"No ConnectorProtocol implementation found in {config.path}")
-
-        # Instantiate
-        return connector_class(self.secrets)
+        return self._find_connector_class(module, config.path)
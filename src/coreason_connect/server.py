@@ -9,7 +9,8 @@
 # Source Code: https://github.com/CoReason-AI/coreason_connect
 
 import json
-from typing import Any, Optional
+import sys
+from typing import Any, Callable, Optional
 
 import anyio
 import httpx
@@ -24,6 +25,24 @@ from coreason_connect.secrets import EnvSecretsProvider
 from coreason_connect.types import ToolDefinition, ToolExecutionError
 from coreason_connect.utils.logger import logger
 
+# Exact-type encoders for the common result types; subclasses fall back to an isinstance check
+_RESULT_ENCODERS: dict[type, Callable[[Any], str]] = {dict: json.dumps, list: json.dumps, str: str}
+
+
+def _encode_result(result: Any) -> str:
+    """Render a tool result as text for an MCP response.
+
+    Args:
+        result: The value returned by a plugin.
+
+    Returns:
+        str: JSON for dicts and lists, ``str(result)`` for everything else.
+    """
+    encoder = _RESULT_ENCODERS.get(type(result))
+    if encoder is None:
+        encoder = json.dumps if isinstance(result, (dict, list)) else str
+    return encoder(result)
+
 
 class CoreasonConnectServiceAsync(Server):
     """The Async MCP Host that aggregates tools and plugins.
@@ -76,19 +95,23 @@ class CoreasonConnectServiceAsync(Server):
         self.tool_registry: dict[str, ToolDefinition] = {}
 
         # Load plugins
-        # Note: We load plugins in __init__ because we are following the structure where
-        # server initialization prepares the environment.
-        # Future refactor could move this to __aenter__ if strictly async I/O is required.
-        self._load_plugins()
+        # Plugin construction (imports, HTTP clients) is deferred until the first tool
+        # listing or call unless the configuration asks for eager loading.
+        self._plugins_loaded = False
+        if self.config.eager_load:
+            self._load_plugins()
 
         # Register handlers
         # Using type: ignore because mcp.server.Server decorators are not typed in a way mypy likes
         self.list_tools()(self._list_tools_handler)  # type: ignore[no-untyped-call]
         self.call_tool()(self._call_tool_handler)
 
-        logger.info(
-            f"Initialized {name} v{version} with {len(self.plugins)} plugins and {len(self.tool_registry)} tools"
-        )
+        if self._plugins_loaded:
+            logger.info(
+                f"Initialized {name} v{version} with {len(self.plugins)} plugins and {len(self.tool_registry)} tools"
+            )
+        else:
+            logger.info(f"Initialized {name} v{version}; plugin loading deferred until first use")
 
     async def __aenter__(self) -> "CoreasonConnectServiceAsync":
         return self
@@ -97,22 +120,43 @@ class CoreasonConnectServiceAsync(Server):
         if self._internal_client:
             await self._client.aclose()
 
+    def ensure_plugins_loaded(self) -> None:
+        """Load plugins and build the tool registry if that has not happened yet."""
+        if not self._plugins_loaded:
+            self._load_plugins()
+
     def _load_plugins(self) -> None:
-        """Load plugins and build the tool registry."""
-        self.plugins = self.plugin_loader.load_all()
+        """Load plugins and build the tool registry.
+
+        Entries registered on the server before the first load keep precedence over the
+        plugins' own definitions, as they would had they been registered after an eager load.
+        """
+        if self._plugins_loaded:
+            registered_plugins: dict[str, ConnectorProtocol] = {}
+            registered_tools: dict[str, ToolDefinition] = {}
+        else:
+            registered_plugins = dict(self.plugin_registry)
+            registered_tools = dict(self.tool_registry)
+
+        self.plugins.update(self.plugin_loader.load_all())
         for plugin_id, plugin in self.plugins.items():
             try:
                 tools = plugin.get_tools()
                 for tool_def in tools:
-                    if tool_def.name in self.tool_registry:
-                        logger.warning(
-                            f"Duplicate tool name '{tool_def.name}' found in plugin '{plugin_id}'. Overwriting."
-                        )
-                    self.plugin_registry[tool_def.name] = plugin
-                    self.tool_registry[tool_def.name] = tool_def
+                    # Interned once here so every registry shares a single key object
+                    tool_name = sys.intern(tool_def.name)
+                    if tool_name in self.tool_registry and tool_name not in registered_tools:
+                        logger.warning(f"Duplicate tool name '{tool_name}' found in plugin '{plugin_id}'. Overwriting.")
+                    self.plugin_registry[tool_name] = plugin
+                    self.tool_registry[tool_name] = tool_def
             except Exception as e:
                 logger.error(f"Failed to get tools from plugin '{plugin_id}': {e}")
 
+        self.plugin_registry.update(registered_plugins)
+        self.tool_registry.update(registered_tools)
+        # Only marked once loading succeeded, so a failed deferred load is retried on next use
+        self._plugins_loaded = True
+
     async def get_all_tools(self) -> list[types.Tool]:
         """Public method to get all tools (wraps handler)."""
         return await self._list_tools_handler()
@@ -134,10 +178,11 @@ class CoreasonConnectServiceAsync(Server):
         # Or better: extract the logic.
 
         # Re-implementing logic here for direct usage (Library mode)
+        self.ensure_plugins_loaded()
         plugin = self.plugin_registry.get(name)
         tool_def = self.tool_registry.get(name)
 
-        if not plugin or not tool_def:
+        if plugin is None or tool_def is None:
             raise ValueError(f"Tool '{name}' not found.")
 
         if tool_def.is_consequential:
@@ -146,7 +191,7 @@ class CoreasonConnectServiceAsync(Server):
             # For library usage, maybe we raise a specific exception?
             # Or just return the string message.
             msg = f"Action suspended: Human approval required for {name}."
-            logger.info(f"Tool execution suspended for approval: {name}")
+            logger.info("Tool execution suspended for approval: {}", name)
             return msg
 
         try:
@@ -161,6 +206,7 @@ class CoreasonConnectServiceAsync(Server):
         Returns:
             list[types.Tool]: A list of Tool objects from all registered plugins.
         """
+        self.ensure_plugins_loaded()
         return [tool_def.tool for tool_def in self.tool_registry.values()]
 
     async def _call_tool_handler(
@@ -179,10 +225,11 @@ class CoreasonConnectServiceAsync(Server):
             list[types.Content]: A list containing the execution result as text content.
         """
         # Logic is similar to execute_tool but formatted for MCP
+        self.ensure_plugins_loaded()
         plugin = self.plugin_registry.get(name)
         tool_def = self.tool_registry.get(name)
 
-        if not plugin or not tool_def:
+        if plugin is None or tool_def is None:
             return [types.TextContent(type="text", text=f"Error: Tool '{name}' not found.")]
 
         # Extract UserContext from arguments if present
@@ -203,26 +250,23 @@ class CoreasonConnectServiceAsync(Server):
                 if isinstance(ctx_data, dict):
                     user_context = UserContext(**ctx_data)
             except Exception as e:
-                logger.warning(f"Failed to deserialize user_context: {e}")
+                logger.warning("Failed to deserialize user_context: {}", e)
 
         # Spend Gate / Transactional Safety Check
+        # Request-path log calls pass arguments separately so loguru only formats emitted records
         if tool_def.is_consequential:
             msg = f"Action suspended: Human approval required for {name}."
-            logger.info(f"Tool execution suspended for approval: {name}")
+            logger.info("Tool execution suspended for approval: {}", name)
             return [types.TextContent(type="text", text=msg)]
 
         try:
             result = plugin.execute(name, arguments, user_context=user_context)
-            if isinstance(result, (dict, list)):
-                result_str = json.dumps(result)
-            else:
-                result_str = str(result)
-            return [types.TextContent(type="text", text=result_str)]
+            return [types.TextContent(type="text", text=_encode_result(result))]
         except ToolExecutionError as e:
-            logger.warning(f"Tool '{name}' execution failed (retryable={e.retryable}): {e}")
+            logger.warning("Tool '{}' execution failed (retryable={}): {}", name, e.retryable, e)
             return [types.TextContent(type="text", text=f"Error: Tool '{name}' failed - {e.message}")]
         except Exception as e:
-            logger.error(f"Error executing tool '{name}': {e}")
+            logger.error("Error executing tool '{}': {}", name, e)
             return [types.TextContent(type="text", text=f"Error executing tool: {str(e)}")]
 
 
@@ -0,0 +1,19 @@
+# Copyright (c) 2025 CoReason, Inc.
+#
+# This software is proprietary and dual-licensed.
+# Licensed under the Prosperity Public License 3.0 (the "License").
+# A copy of the license is available at https://prosperitylicense.com/versions/3.0.0
+# For details, see the LICENSE file.
+# Commercial use beyond a 30-day trial requires a separate license.
+#
+# Source Code: https://github.com/CoReason-AI/coreason_connect
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def cfg_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A directory shared by the module's tests; each test writes its own file name."""
+    return tmp_path_factory.mktemp("cfg")
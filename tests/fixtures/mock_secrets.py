@@ -0,0 +1,21 @@
+# Copyright (c) 2025 CoReason, Inc.
+#
+# This software is proprietary and dual-licensed.
+# Licensed under the Prosperity Public License 3.0 (the "License").
+# A copy of the license is available at https://prosperitylicense.com/versions/3.0.0
+# For details, see the LICENSE file.
+# Commercial use beyond a 30-day trial requires a separate license.
+#
+# Source Code: https://github.com/CoReason-AI/coreason_connect
+
+from coreason_connect.interfaces import SecretsProvider
+
+
+class MockSecrets(SecretsProvider):
+    """A secrets provider that returns an empty value for every key."""
+
+    def get_secret(self, key: str) -> str:
+        return ""
+
+    def get_user_credential(self, key: str) -> str:
+        return ""
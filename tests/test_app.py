@@ -102,7 +102,10 @@ def client(
 
 def test_health_endpoint(client: TestClient, mock_service: MagicMock) -> None:
     """Test the /health endpoint returns correct status and plugins."""
+    # Plugins are loaded once during startup; the health check only reads the registries
+    mock_service.ensure_plugins_loaded.assert_called_once()
     response = client.get("/health")
+    mock_service.ensure_plugins_loaded.assert_called_once()
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "live"
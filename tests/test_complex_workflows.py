@@ -16,14 +16,16 @@ import pytest
 from coreason_connect.interfaces import SecretsProvider
 from coreason_connect.plugins.ms365 import MS365Connector
 from coreason_connect.server import CoreasonConnectServiceAsync
+from tests.fixtures.mock_secrets import MockSecrets
 
 
-@pytest.fixture
+# Setup is shared per module; tests must not mutate the server's registries or plugins.
+@pytest.fixture(scope="module")
 def mock_secrets() -> SecretsProvider:
-    return MagicMock(spec=SecretsProvider)
+    return MockSecrets()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_graph_client() -> Generator[MagicMock, None, None]:
     with patch("coreason_connect.plugins.ms365.GraphClientFactory.create_with_default_middleware") as mock_factory:
         mock_client = MagicMock()
@@ -31,12 +33,18 @@ def mock_graph_client() -> Generator[MagicMock, None, None]:
         yield mock_client
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def reset_graph_client(mock_graph_client: MagicMock) -> None:
+    """Clear recorded calls and configured responses between tests."""
+    mock_graph_client.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
 def ms365_plugin(mock_secrets: SecretsProvider, mock_graph_client: MagicMock) -> MS365Connector:
     return MS365Connector(mock_secrets)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def server(mock_secrets: SecretsProvider, ms365_plugin: MS365Connector) -> CoreasonConnectServiceAsync:
     s = CoreasonConnectServiceAsync(secrets=mock_secrets)
     # Register MS365 plugin manually
@@ -10,30 +10,30 @@
 
 import os
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from typing import Generator
+from unittest.mock import patch
 
 import pytest
 import yaml
 
-from coreason_connect.config import AppConfig, load_config
+from coreason_connect.config import AppConfig, PluginConfig, clear_config_cache, force_str, load_config
 
 
-def test_load_config_valid_yaml(tmp_path: Path) -> None:
+def test_load_config_valid_yaml(cfg_dir: Path) -> None:
     """Test loading a valid configuration file."""
-    config_file = tmp_path / "test_config.yaml"
-    data = {
-        "plugins": [
-            {
-                "id": "test-plugin",
-                "type": "local_python",
-                "path": "./libs/test.py",
-                "description": "A test plugin",
-                "env_vars": {"KEY": "VALUE"},
-            }
-        ]
-    }
-    with open(config_file, "w") as f:
-        yaml.dump(data, f)
+    config_file = cfg_dir / "test_config.yaml"
+    config_file.write_text(
+        """
+plugins:
+  - id: test-plugin
+    type: local_python
+    path: ./libs/test.py
+    description: A test plugin
+    env_vars:
+      KEY: VALUE
+""",
+        encoding="utf-8",
+    )
 
     config = load_config(config_file)
     assert isinstance(config, AppConfig)
@@ -50,9 +50,9 @@ def test_load_config_missing_file() -> None:
         load_config("non_existent_config.yaml")
 
 
-def test_load_config_invalid_yaml(tmp_path: Path) -> None:
+def test_load_config_invalid_yaml(cfg_dir: Path) -> None:
     """Test that ValueError is raised for invalid YAML."""
-    config_file = tmp_path / "bad.yaml"
+    config_file = cfg_dir / "bad.yaml"
     with open(config_file, "w") as f:
         f.write("plugins: [unclosed list")
 
@@ -60,24 +60,26 @@ def test_load_config_invalid_yaml(tmp_path: Path) -> None:
         load_config(config_file)
 
 
-def test_load_config_validation_error(tmp_path: Path) -> None:
+def test_load_config_validation_error(cfg_dir: Path) -> None:
     """Test that ValueError is raised when Pydantic validation fails."""
-    config_file = tmp_path / "invalid_schema.yaml"
+    config_file = cfg_dir / "invalid_schema.yaml"
     # Missing required 'id' and 'type'
-    data = {"plugins": [{"path": "some/path"}]}
-    with open(config_file, "w") as f:
-        yaml.dump(data, f)
+    config_file.write_text(
+        """
+plugins:
+  - path: some/path
+""",
+        encoding="utf-8",
+    )
 
     with pytest.raises(ValueError, match="Configuration validation failed"):
         load_config(config_file)
 
 
-def test_load_config_env_var_override(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_load_config_env_var_override(cfg_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that COREASON_CONFIG_PATH overrides the default."""
-    config_file = tmp_path / "env_config.yaml"
-    data: dict[str, list[dict[str, str]]] = {"plugins": []}
-    with open(config_file, "w") as f:
-        yaml.dump(data, f)
+    config_file = cfg_dir / "env_config.yaml"
+    config_file.write_text("plugins: []\n", encoding="utf-8")
 
     monkeypatch.setenv("COREASON_CONFIG_PATH", str(config_file))
     config = load_config()  # Should pick up env var
@@ -85,33 +87,39 @@ def test_load_config_env_var_override(tmp_path: Path, monkeypatch: pytest.Monkey
     assert config.plugins == []
 
 
-def test_load_config_default_path_exists(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_load_config_default_path_exists(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that it defaults to connectors.yaml if env var not set."""
     monkeypatch.delenv("COREASON_CONFIG_PATH", raising=False)
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "connectors.yaml").write_text("plugins: []\n", encoding="utf-8")
 
-    # Mock Path.exists and open to simulate connectors.yaml existing
-    with patch("coreason_connect.config.Path.exists", return_value=True) as mock_exists:
-        with patch("builtins.open", new_callable=MagicMock) as mock_open:
-            # Mock file content
-            mock_file = MagicMock()
-            mock_file.__enter__.return_value = "plugins: []"
-            mock_open.return_value = mock_file
-
-            # We also need to mock yaml.safe_load because we are mocking open
-            with patch("coreason_connect.config.yaml.safe_load", return_value={"plugins": []}):
-                config = load_config()
+    config = load_config()
 
     assert isinstance(config, AppConfig)
-    mock_exists.assert_called()
-    # Check that it checked for "connectors.yaml"
-    # The path object created inside load_config will be "connectors.yaml"
-    # We can check the args to the mocked exists or open
-    assert "connectors.yaml" in str(mock_exists.call_args_list[0]) or "connectors.yaml" in str(mock_open.call_args[0])
+    assert config.plugins == []
+
+
+def test_load_config_file_removed_after_existence_check(cfg_dir: Path) -> None:
+    """Test that a file disappearing between the existence check and stat() is not cached."""
+    vanished = cfg_dir / "vanished.yaml"
+    with patch("coreason_connect.config.Path.exists", return_value=True):
+        with pytest.raises(FileNotFoundError):
+            load_config(vanished)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="symlink creation needs extra privileges on Windows")
+def test_load_config_symlink_loop(cfg_dir: Path) -> None:
+    """Test that a symlink loop is reported as a missing configuration file."""
+    loop = cfg_dir / "loop.yaml"
+    loop.symlink_to(loop)
+
+    with pytest.raises(FileNotFoundError, match="Configuration file not found"):
+        load_config(loop)
 
 
-def test_load_config_empty_file(tmp_path: Path) -> None:
+def test_load_config_empty_file(cfg_dir: Path) -> None:
     """Test loading an empty file results in empty config (if valid) or error."""
-    config_file = tmp_path / "empty.yaml"
+    config_file = cfg_dir / "empty.yaml"
     with open(config_file, "w") as f:
         f.write("")  # Empty file returns None from safe_load usually
 
@@ -121,9 +129,9 @@ def test_load_config_empty_file(tmp_path: Path) -> None:
     assert config.plugins == []
 
 
-def test_load_config_not_dict_root(tmp_path: Path) -> None:
+def test_load_config_not_dict_root(cfg_dir: Path) -> None:
     """Test that a list root raises ValueError."""
-    config_file = tmp_path / "list_root.yaml"
+    config_file = cfg_dir / "list_root.yaml"
     with open(config_file, "w") as f:
         f.write("- item1\n- item2")
 
@@ -131,36 +139,47 @@ def test_load_config_not_dict_root(tmp_path: Path) -> None:
         load_config(config_file)
 
 
-def test_load_config_duplicate_ids(tmp_path: Path) -> None:
+def test_load_config_duplicate_ids(cfg_dir: Path) -> None:
     """Test that duplicate plugin IDs raise a ValueError."""
-    config_file = tmp_path / "dup.yaml"
-    data = {
-        "plugins": [
-            {"id": "p1", "type": "native"},
-            {"id": "p1", "type": "local_python"},
-        ]
-    }
-    with open(config_file, "w") as f:
-        yaml.dump(data, f)
+    config_file = cfg_dir / "dup.yaml"
+    config_file.write_text(
+        """
+plugins:
+  - id: p1
+    type: native
+  - id: p1
+    type: local_python
+""",
+        encoding="utf-8",
+    )
 
     with pytest.raises(ValueError, match="Duplicate plugin IDs found"):
         load_config(config_file)
 
 
-def test_load_config_type_coercion(tmp_path: Path) -> None:
+def test_duplicate_ids_report_is_truncated() -> None:
+    """Test that the duplicate ID report is capped at the 10 most common offenders."""
+    plugins = [{"id": f"p{i}", "type": "native"} for i in range(20)] * 2
+    with pytest.raises(ValueError, match="Duplicate plugin IDs found") as exc_info:
+        AppConfig(plugins=plugins)
+    reported = str(exc_info.value).split("found: {")[1].split("}")[0]
+    assert len(reported.split(", ")) == 10
+
+
+def test_load_config_type_coercion(cfg_dir: Path) -> None:
     """Test that types are coerced (e.g., int to str in env_vars)."""
-    config_file = tmp_path / "coercion.yaml"
-    data = {
-        "plugins": [
-            {
-                "id": "p1",
-                "type": "native",
-                "env_vars": {"PORT": 8080, "DEBUG": True},
-            }
-        ]
-    }
-    with open(config_file, "w") as f:
-        yaml.dump(data, f)
+    config_file = cfg_dir / "coercion.yaml"
+    config_file.write_text(
+        """
+plugins:
+  - id: p1
+    type: native
+    env_vars:
+      PORT: 8080
+      DEBUG: true
+""",
+        encoding="utf-8",
+    )
 
     config = load_config(config_file)
     plugin = config.plugins[0]
@@ -168,20 +187,18 @@ def test_load_config_type_coercion(tmp_path: Path) -> None:
     assert plugin.env_vars["DEBUG"] == "True"  # Pydantic converts True to "True"
 
 
-def test_load_config_unicode(tmp_path: Path) -> None:
+def test_load_config_unicode(cfg_dir: Path) -> None:
     """Test handling of unicode characters."""
-    config_file = tmp_path / "unicode.yaml"
-    data = {
-        "plugins": [
-            {
-                "id": "emoji-🚀",
-                "type": "native",
-                "description": "Café operation",
-            }
-        ]
-    }
-    with open(config_file, "w", encoding="utf-8") as f:
-        yaml.dump(data, f, allow_unicode=True)
+    config_file = cfg_dir / "unicode.yaml"
+    config_file.write_text(
+        """
+plugins:
+  - id: "emoji-\N{ROCKET}"
+    type: native
+    description: "Caf\N{LATIN SMALL LETTER E WITH ACUTE} operation"
+""",
+        encoding="utf-8",
+    )
 
     config = load_config(config_file)
     plugin = config.plugins[0]
@@ -189,22 +206,96 @@ def test_load_config_unicode(tmp_path: Path) -> None:
     assert plugin.description == "Café operation"
 
 
-def test_load_config_permission_error(tmp_path: Path) -> None:
-    """Test handling of permission errors."""
-    if os.name == "nt":  # Skip on Windows as chmod behavior is different
-        return
+def test_load_config_is_memoized(cfg_dir: Path) -> None:
+    """Test that an unchanged file is parsed only once."""
+    config_file = cfg_dir / "cached.yaml"
+    config_file.write_text("plugins: []", encoding="utf-8")
+    clear_config_cache()
 
-    config_file = tmp_path / "protected.yaml"
-    config_file.touch()
+    with patch("coreason_connect.config.yaml.load", wraps=yaml.load) as mock_load:
+        first = load_config(config_file)
+        second = load_config(config_file)
+
+    assert first == second
+    assert mock_load.call_count == 1
+
+
+def test_load_config_cached_result_is_isolated(cfg_dir: Path) -> None:
+    """Test that modifying a returned configuration does not change later loads."""
+    config_file = cfg_dir / "isolated.yaml"
+    config_file.write_text("plugins:\n  - id: p1\n    type: native\n", encoding="utf-8")
+    clear_config_cache()
 
+    first = load_config(config_file)
+    first.plugins[0].id = "changed"
+    first.plugins.append(PluginConfig(id="p2", type="native"))
+    second = load_config(config_file)
+    second.plugins[0].env_vars["KEY"] = "VALUE"
+
+    third = load_config(config_file)
+    assert [p.id for p in third.plugins] == ["p1"]
+    assert third.plugins[0].env_vars == {}
+
+
+def test_load_config_cache_invalidated_on_change(cfg_dir: Path) -> None:
+    """Test that modifying the file or clearing the cache forces a re-parse."""
+    config_file = cfg_dir / "changing.yaml"
+    config_file.write_text("plugins: []", encoding="utf-8")
+    clear_config_cache()
+
+    with patch("coreason_connect.config.yaml.load", wraps=yaml.load) as mock_load:
+        load_config(config_file)
+        config_file.write_text("plugins:\n  - id: p1\n    type: native\n", encoding="utf-8")
+        second = load_config(config_file)
+        assert mock_load.call_count == 2
+        assert [p.id for p in second.plugins] == ["p1"]
+
+        clear_config_cache()
+        load_config(config_file)
+        assert mock_load.call_count == 3
+
+
+def test_load_config_cache_evicts_least_recently_used(cfg_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the configuration cache is bounded."""
+    monkeypatch.setattr("coreason_connect.config._CONFIG_CACHE_MAX_ENTRIES", 1)
+    first_file = cfg_dir / "first.yaml"
+    second_file = cfg_dir / "second.yaml"
+    first_file.write_text("plugins: []", encoding="utf-8")
+    second_file.write_text("plugins: []", encoding="utf-8")
+    clear_config_cache()
+
+    with patch("coreason_connect.config.yaml.load", wraps=yaml.load) as mock_load:
+        load_config(first_file)
+        load_config(second_file)
+        load_config(first_file)
+
+    assert mock_load.call_count == 3
+
+
+@pytest.fixture(scope="session")
+def protected_yaml(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path, None, None]:
+    """An unreadable configuration file, created once per session."""
+    config_file = tmp_path_factory.mktemp("perm") / "protected.yaml"
+    config_file.touch()
     # Remove read permissions
     config_file.chmod(0o000)
+    yield config_file
+    # Restore permissions so cleanup works
+    config_file.chmod(0o666)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="chmod behavior is different on Windows")
+@pytest.mark.skipif(hasattr(os, "geteuid") and os.geteuid() == 0, reason="root bypasses file permissions")
+def test_load_config_permission_error(protected_yaml: Path) -> None:
+    """Test handling of permission errors."""
+    # Reading the unreadable file should surface PermissionError unchanged
+    with pytest.raises(PermissionError):
+        load_config(protected_yaml)
+
 
-    try:
-        # Pydantic/YAML load fails when file can't be opened
-        # But load_config calls open(), which should raise PermissionError
-        with pytest.raises(PermissionError):
-            load_config(config_file)
-    finally:
-        # Restore permissions so cleanup works
-        config_file.chmod(0o666)
+def test_force_str() -> None:
+    """Test that force_str passes strings through and stringifies everything else."""
+    value = "already-a-string"
+    assert force_str(value) is value
+    assert force_str(8080) == "8080"
+    assert force_str(None) == "None"
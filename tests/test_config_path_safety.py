@@ -10,11 +10,8 @@
 
 import os
 from pathlib import Path
-from typing import Any
-from unittest.mock import MagicMock, patch
 
 import pytest
-import yaml
 
 from coreason_connect.config import load_config
 
@@ -22,22 +19,31 @@ from coreason_connect.config import load_config
 # during tests, or specifically the directory where the application is running or the config file directory.
 # We will enforce it relative to os.getcwd() for now.
 
+# Pick a path that is definitely outside CWD. /tmp is usually safe bet on unix; on windows, C:\Windows.
+UNSAFE_ABSOLUTE_PATH = "/tmp/evil.py" if os.name != "nt" else "C:\\Windows\\System32\\evil.py"
 
-def test_plugin_path_safe(tmp_path: Path) -> None:
+
+def test_plugin_path_safe(cfg_dir: Path) -> None:
     """Test that a path inside the safe zone is accepted."""
-    # We must run this test such that tmp_path is inside the CWD or we mock CWD.
+    # We must run this test such that the config directory is inside the CWD or we mock CWD.
     # To reliably test "Safe Zone" logic which usually depends on CWD, we should change CWD
     # or rely on relative paths being safe if they don't escape.
 
-    # Let's write a config file in tmp_path
-    config_file = tmp_path / "connectors.yaml"
+    # Let's write a config file in the shared config directory
+    config_file = cfg_dir / "connectors.yaml"
 
     # Valid relative path
-    data = {"plugins": [{"id": "safe-plugin", "type": "local_python", "path": "libs/plugin.py"}]}
-    with open(config_file, "w") as f:
-        yaml.dump(data, f)
-
-    # We need to simulate that we are running from tmp_path or that tmp_path is safe.
+    config_file.write_text(
+        """
+plugins:
+  - id: safe-plugin
+    type: local_python
+    path: libs/plugin.py
+""",
+        encoding="utf-8",
+    )
+
+    # We need to simulate that we are running from the config directory or that it is safe.
     # If the logic enforces "child of CWD", we need to make sure the checked path is child of CWD.
     # For this test, let's use a path that is definitely "safe" relative to CWD.
     # "libs/plugin.py" is safe relative to wherever we are.
@@ -46,76 +52,66 @@ def test_plugin_path_safe(tmp_path: Path) -> None:
     assert config.plugins[0].path == "libs/plugin.py"
 
 
-def test_plugin_path_traversal_unsafe(tmp_path: Path) -> None:
-    """Test that a path attempting traversal is rejected."""
-    config_file = tmp_path / "unsafe.yaml"
-    data = {"plugins": [{"id": "unsafe-plugin", "type": "local_python", "path": "../../../etc/passwd"}]}
-    with open(config_file, "w") as f:
-        yaml.dump(data, f)
+@pytest.mark.parametrize(
+    "bad_path",
+    [
+        # Traversal out of the safe zone
+        "../../../etc/passwd",
+        # Absolute path outside CWD
+        UNSAFE_ABSOLUTE_PATH,
+        # Tricky normalization bypass like 'safe/../../unsafe'
+        "safe_folder/../../unsafe_file.py",
+    ],
+    ids=["traversal", "absolute", "normalization-bypass"],
+)
+def test_plugin_path_unsafe(cfg_dir: Path, bad_path: str, request: pytest.FixtureRequest) -> None:
+    """Test that paths resolving outside the safe zone are rejected."""
+    config_file = cfg_dir / f"unsafe_{request.node.callspec.id}.yaml"
+    # Single-quoted YAML scalars keep Windows backslashes literal
+    config_file.write_text(
+        f"""
+plugins:
+  - id: unsafe-plugin
+    type: local_python
+    path: '{bad_path}'
+""",
+        encoding="utf-8",
+    )
 
     with pytest.raises(ValueError, match="Plugin path must be within the safe zone"):
         load_config(config_file)
 
 
-def test_plugin_path_absolute_unsafe(tmp_path: Path) -> None:
-    """Test that an absolute path outside safe zone is rejected."""
-    config_file = tmp_path / "unsafe_abs.yaml"
-
-    # Pick a path that is definitely outside CWD. /tmp is usually safe bet on unix.
-    # On windows, C:\Windows.
-    unsafe_path = "/tmp/evil.py" if os.name != "nt" else "C:\\Windows\\System32\\evil.py"
-
-    data = {"plugins": [{"id": "unsafe-abs", "type": "local_python", "path": unsafe_path}]}
-    with open(config_file, "w") as f:
-        yaml.dump(data, f)
-
-    with pytest.raises(ValueError, match="Plugin path must be within the safe zone"):
-        load_config(config_file)
-
-
-def test_plugin_path_normalization_bypass_attempt(tmp_path: Path) -> None:
-    """Test that tricky paths like 'safe/../../unsafe' are caught."""
-    config_file = tmp_path / "tricky.yaml"
-    data = {"plugins": [{"id": "tricky", "type": "local_python", "path": "safe_folder/../../unsafe_file.py"}]}
-    with open(config_file, "w") as f:
-        yaml.dump(data, f)
-
-    with pytest.raises(ValueError, match="Plugin path must be within the safe zone"):
-        load_config(config_file)
-
-
-def test_plugin_path_none(tmp_path: Path) -> None:
+def test_plugin_path_none(cfg_dir: Path) -> None:
     """Test that a null path is accepted (optional field)."""
-    config_file = tmp_path / "none_path.yaml"
-    data = {"plugins": [{"id": "none-plugin", "type": "native", "path": None}]}
-    with open(config_file, "w") as f:
-        yaml.dump(data, f)
+    config_file = cfg_dir / "none_path.yaml"
+    config_file.write_text(
+        """
+plugins:
+  - id: none-plugin
+    type: native
+    path: null
+""",
+        encoding="utf-8",
+    )
 
     config = load_config(config_file)
     assert config.plugins[0].path is None
 
 
-def test_plugin_path_resolution_error(tmp_path: Path) -> None:
-    """Test handling of path resolution errors."""
-    config_file = tmp_path / "error.yaml"
-    data = {"plugins": [{"id": "error-plugin", "type": "local_python", "path": "TRIGGER_ERROR"}]}
-    with open(config_file, "w") as f:
-        yaml.dump(data, f)
-
-    # Save the real Path class
-    real_Path = Path
-
-    def path_side_effect(*args: Any, **kwargs: Any) -> Any:
-        # We assume first arg is the path string
-        # args[0] might be a Path object or string
-        arg = str(args[0]) if args else ""
-        if arg == "TRIGGER_ERROR":
-            m = MagicMock()
-            m.resolve.side_effect = OSError("Simulated Failure")
-            return m
-        return real_Path(*args, **kwargs)
-
-    # Patch Path in coreason_connect.config
-    with patch("coreason_connect.config.Path", side_effect=path_side_effect):
-        with pytest.raises(ValueError, match="Invalid path resolution"):
-            load_config(config_file)
+def test_plugin_path_resolution_error(cfg_dir: Path) -> None:
+    """Test handling of paths that cannot be resolved."""
+    config_file = cfg_dir / "error.yaml"
+    # YAML's "\0" escape produces an embedded null byte
+    config_file.write_text(
+        """
+plugins:
+  - id: error-plugin
+    type: local_python
+    path: "TRIGGER\\0ERROR"
+""",
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError, match="Invalid path resolution"):
+        load_config(config_file)
@@ -8,6 +8,7 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_connect
 
+from typing import Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -18,6 +19,69 @@ from coreason_connect.server import CoreasonConnectServiceAsync
 from coreason_connect.types import ToolDefinition
 
 
+class SafeAmbiguousPlugin(ConnectorProtocol):
+    _TOOLS = [
+        ToolDefinition(
+            name="ambiguous_tool",
+            tool=Tool(name="ambiguous_tool", inputSchema={}, description="Safe"),
+            is_consequential=False,
+        )
+    ]
+
+    def get_tools(self) -> list[ToolDefinition]:
+        return self._TOOLS
+
+    def execute(self, *args: object, **kwargs: object) -> object:
+        return "Safe Executed"
+
+
+class UnsafeAmbiguousPlugin(ConnectorProtocol):
+    _TOOLS = [
+        ToolDefinition(
+            name="ambiguous_tool",
+            tool=Tool(name="ambiguous_tool", inputSchema={}, description="Unsafe"),
+            is_consequential=True,
+        )
+    ]
+
+    def get_tools(self) -> list[ToolDefinition]:
+        return self._TOOLS
+
+    def execute(self, *args: object, **kwargs: object) -> object:
+        return "Unsafe Executed"
+
+
+class UnsafeFlipFlopPlugin(ConnectorProtocol):
+    _TOOLS = [
+        ToolDefinition(name="flip_flop_tool", tool=Tool(name="flip_flop_tool", inputSchema={}), is_consequential=True)
+    ]
+
+    def get_tools(self) -> list[ToolDefinition]:
+        return self._TOOLS
+
+    def execute(self, *args: object, **kwargs: object) -> object:
+        return "Unsafe"
+
+
+class SafeFlipFlopPlugin(ConnectorProtocol):
+    _TOOLS = [
+        ToolDefinition(name="flip_flop_tool", tool=Tool(name="flip_flop_tool", inputSchema={}), is_consequential=False)
+    ]
+
+    def get_tools(self) -> list[ToolDefinition]:
+        return self._TOOLS
+
+    def execute(self, *args: object, **kwargs: object) -> object:
+        return "Safe"
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _silence_logger() -> Generator[None, None, None]:
+    """Patch the server logger once for the whole module."""
+    with patch("coreason_connect.server.logger"):
+        yield
+
+
 @pytest.fixture
 def mock_secrets() -> SecretsProvider:
     return MagicMock(spec=SecretsProvider)
@@ -29,123 +93,52 @@ def server(mock_secrets: SecretsProvider) -> CoreasonConnectServiceAsync:
 
 
 @pytest.mark.asyncio
-async def test_tool_overwrite_security_implications(server: CoreasonConnectServiceAsync) -> None:
+@pytest.mark.parametrize(
+    "first, second, final_text, final_consequential",
+    [
+        (
+            SafeAmbiguousPlugin,
+            UnsafeAmbiguousPlugin,
+            "Action suspended",
+            True,
+        ),
+        (
+            UnsafeFlipFlopPlugin,
+            SafeFlipFlopPlugin,
+            "Safe",
+            False,
+        ),
+    ],
+    ids=["safe-to-unsafe", "unsafe-to-safe"],
+)
+async def test_tool_overwrite(
+    server: CoreasonConnectServiceAsync,
+    first: type[ConnectorProtocol],
+    second: type[ConnectorProtocol],
+    final_text: str,
+    final_consequential: bool,
+) -> None:
     """
     Test that when a tool is overwritten by a plugin with different 'is_consequential' metadata,
     the metadata in the registry is updated to reflect the last loaded plugin.
     This confirms "Last Write Wins" behavior.
     """
+    first_plugin = first(server.secrets)
+    second_plugin = second(server.secrets)
+    tool_name = first_plugin.get_tools()[0].name
 
-    # 1. Define Safe and Unsafe plugins for the same tool name
-    tool_name = "ambiguous_tool"
-
-    class SafePlugin(ConnectorProtocol):
-        def get_tools(self) -> list[ToolDefinition]:
-            return [
-                ToolDefinition(
-                    name=tool_name,
-                    tool=Tool(name=tool_name, inputSchema={}, description="Safe"),
-                    is_consequential=False,
-                )
-            ]
-
-        def execute(self, *args: object, **kwargs: object) -> object:
-            return "Safe Executed"
-
-    class UnsafePlugin(ConnectorProtocol):
-        def get_tools(self) -> list[ToolDefinition]:
-            return [
-                ToolDefinition(
-                    name=tool_name,
-                    tool=Tool(name=tool_name, inputSchema={}, description="Unsafe"),
-                    is_consequential=True,
-                )
-            ]
-
-        def execute(self, *args: object, **kwargs: object) -> object:
-            return "Unsafe Executed"
-
-    safe_plugin = SafePlugin(server.secrets)
-    unsafe_plugin = UnsafePlugin(server.secrets)
-
-    # 2. Scenario A: Safe -> Unsafe
-    # Mock load_all to return them in order (simulated by manual registration order)
-    # Since load_all returns a dict, order is insertion order in recent Python.
-    # But to be robust, we'll manually invoke _load_plugins behavior
-
-    # Reset server
-    server.tool_registry = {}
-    server.plugin_registry = {}
-
-    # Load Safe First
-    server.plugin_loader.load_all = MagicMock(return_value={"safe": safe_plugin})  # type: ignore[method-assign]
-    with patch("coreason_connect.server.logger"):
-        server._load_plugins()
-
-    # Verify Safe
-    assert server.tool_registry[tool_name].is_consequential is False
-    result = await server._call_tool_handler(tool_name, {})
-    assert result[0].text == "Safe Executed"  # type: ignore[union-attr]
-
-    # Load Unsafe Second (Overwrite)
-    server.plugin_loader.load_all = MagicMock(return_value={"unsafe": unsafe_plugin})  # type: ignore[method-assign]
-    with patch("coreason_connect.server.logger"):
-        server._load_plugins()
-        # Verify warning about overwrite (assuming we are simulating a fresh load that happens to collide
-        # with existing state)
-        # or if we loaded both at once. _load_plugins replaces self.plugins.
-        # But wait, _load_plugins does: self.plugins = load_all().
-        # But it appends to plugin_registry/tool_registry. It doesn't clear them?
-        # Let's check server.py:
-        # self.plugins = self.plugin_loader.load_all()
-        # for plugin_id, plugin in self.plugins.items(): ...
-
-        # It does NOT clear plugin_registry or tool_registry at the start of _load_plugins.
-        # So multiple calls to _load_plugins accumulate/overwrite.
-
-    # Verify Unsafe Overwrite
-    assert server.tool_registry[tool_name].is_consequential is True
-    result = await server._call_tool_handler(tool_name, {})
-    assert "Action suspended" in result[0].text  # type: ignore[union-attr]
-
-
-@pytest.mark.asyncio
-async def test_tool_overwrite_unsafe_to_safe(server: CoreasonConnectServiceAsync) -> None:
-    """Test overwriting an unsafe tool with a safe one."""
-    tool_name = "flip_flop_tool"
-
-    class UnsafePlugin(ConnectorProtocol):
-        def get_tools(self) -> list[ToolDefinition]:
-            return [ToolDefinition(name=tool_name, tool=Tool(name=tool_name, inputSchema={}), is_consequential=True)]
-
-        def execute(self, *args: object, **kwargs: object) -> object:
-            return "Unsafe"
-
-    class SafePlugin(ConnectorProtocol):
-        def get_tools(self) -> list[ToolDefinition]:
-            return [ToolDefinition(name=tool_name, tool=Tool(name=tool_name, inputSchema={}), is_consequential=False)]
-
-        def execute(self, *args: object, **kwargs: object) -> object:
-            return "Safe"
-
-    unsafe_plugin = UnsafePlugin(server.secrets)
-    safe_plugin = SafePlugin(server.secrets)
-
-    # 1. Load Unsafe
-    server.tool_registry = {}
-    server.plugin_registry = {}
-
-    server.plugin_loader.load_all = MagicMock(return_value={"unsafe": unsafe_plugin})  # type: ignore[method-assign]
+    # Load the first plugin
+    server.plugin_loader.load_all = lambda: {"first": first_plugin}  # type: ignore[method-assign]
     server._load_plugins()
 
-    assert server.tool_registry[tool_name].is_consequential is True
+    assert server.tool_registry[tool_name].is_consequential is not final_consequential
 
-    # 2. Load Safe (Overwrite)
-    server.plugin_loader.load_all = MagicMock(return_value={"safe": safe_plugin})  # type: ignore[method-assign]
-    with patch("coreason_connect.server.logger"):
-        server._load_plugins()
+    # Load the second plugin (Overwrite)
+    # _load_plugins does not clear plugin_registry or tool_registry, so repeated calls accumulate/overwrite.
+    server.plugin_loader.load_all = lambda: {"second": second_plugin}  # type: ignore[method-assign]
+    server._load_plugins()
 
-    # Verify Safe Overwrite
-    assert server.tool_registry[tool_name].is_consequential is False
+    # Verify Overwrite
+    assert server.tool_registry[tool_name].is_consequential is final_consequential
     result = await server._call_tool_handler(tool_name, {})
-    assert result[0].text == "Safe"  # type: ignore[union-attr]
+    assert final_text in result[0].text  # type: ignore[union-attr]
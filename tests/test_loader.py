@@ -10,16 +10,22 @@
 
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
-from unittest.mock import Mock, patch
+from types import ModuleType
+from typing import Any, Generator, Optional
+from unittest.mock import patch
 
 import pytest
 from coreason_identity.models import UserContext
 
-from coreason_connect.config import load_config
-from coreason_connect.interfaces import SecretsProvider
+from coreason_connect.config import AppConfig, PluginConfig, load_config
+from coreason_connect.interfaces import ConnectorProtocol, SecretsProvider
 from coreason_connect.loader import PluginLoader
+from coreason_connect.types import ToolDefinition
 
 
 class MockSecrets(SecretsProvider):
@@ -30,35 +36,57 @@ class MockSecrets(SecretsProvider):
         return {"user": "test"}
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def restore_sys_path() -> Generator[None, None, None]:
+    """Restore sys.path after each test so a leaking import cannot affect its neighbours."""
+    saved = list(sys.path)
+    yield
+    sys.path[:] = saved
+
+
+@pytest.fixture(scope="session")
 def mock_secrets() -> SecretsProvider:
     return MockSecrets()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures_dir() -> str:
     return os.path.join(os.path.dirname(__file__), "fixtures")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config_path(fixtures_dir: str) -> str:
     return os.path.join(fixtures_dir, "connectors.yaml")
 
 
+@pytest.fixture(scope="session")
+def parsed_config(config_path: str) -> AppConfig:
+    """The shared fixture configuration, parsed once per session."""
+    return load_config(config_path)
+
+
+@pytest.fixture(scope="session")
+def loaded_plugins(parsed_config: AppConfig, mock_secrets: SecretsProvider) -> dict[str, ConnectorProtocol]:
+    """Plugins from the shared fixture configuration, imported and instantiated once per session."""
+    return PluginLoader(parsed_config, mock_secrets).load_all()
+
+
+@lru_cache(maxsize=256)
 def normalize_path(path: str) -> str:
-    """Normalize path to posix style to avoid YAML escape issues on Windows."""
+    """Normalize path to posix style so fixture paths look the same on every platform."""
     return Path(path).as_posix()
 
 
-def test_load_valid_plugin(config_path: str, mock_secrets: SecretsProvider) -> None:
-    """Test loading a valid plugin that imports a sibling library."""
-    config = load_config(config_path)
-    loader = PluginLoader(config, mock_secrets)
+def local_plugin(plugin_id: str, relative_path: str) -> PluginConfig:
+    """Build a local_python plugin configuration pointing into the fixtures directory."""
+    path = normalize_path(os.path.join(os.path.dirname(__file__), "fixtures", relative_path))
+    return PluginConfig(id=plugin_id, type="local_python", path=path)
 
-    plugins = loader.load_all()
 
-    assert "valid-plugin" in plugins
-    plugin = plugins["valid-plugin"]
+def test_load_valid_plugin(loaded_plugins: dict[str, ConnectorProtocol]) -> None:
+    """Test loading a valid plugin that imports a sibling library."""
+    assert "valid-plugin" in loaded_plugins
+    plugin = loaded_plugins["valid-plugin"]
 
     # Check if the sibling import worked
     # The ValidAdapter execution returns self.client_loaded for "check_import"
@@ -66,121 +94,73 @@ def test_load_valid_plugin(config_path: str, mock_secrets: SecretsProvider) -> N
     assert is_loaded is True
 
 
-def test_valid_plugin_has_get_data_tool(config_path: str, mock_secrets: SecretsProvider) -> None:
+def test_valid_plugin_has_get_data_tool(loaded_plugins: dict[str, ConnectorProtocol]) -> None:
     """Test that the valid plugin exposes the 'get_data' tool."""
-    config = load_config(config_path)
-    loader = PluginLoader(config, mock_secrets)
-
-    plugins = loader.load_all()
-    plugin = plugins["valid-plugin"]
+    plugin = loaded_plugins["valid-plugin"]
 
     tools = plugin.get_tools()
     tool_names = [t.name for t in tools]
     assert "get_data" in tool_names
 
 
-def test_load_invalid_plugin(config_path: str, mock_secrets: SecretsProvider) -> None:
+def test_load_invalid_plugin(loaded_plugins: dict[str, ConnectorProtocol]) -> None:
     """Test that an invalid plugin (wrong interface) is gracefully skipped."""
-    config = load_config(config_path)
-    loader = PluginLoader(config, mock_secrets)
-
-    plugins = loader.load_all()
-
     # "invalid-plugin" should not be in the results because it failed validation
-    assert "invalid-plugin" not in plugins
-
-
-def test_load_missing_file(mock_secrets: SecretsProvider, tmp_path: Path) -> None:
-    """Test that a missing file is gracefully skipped."""
-    # Create a config pointing to a non-existent file
-    config_file = tmp_path / "bad_config.yaml"
-    config_file.write_text("""
-plugins:
-  - id: "missing-plugin"
-    type: "local_python"
-    path: "non_existent.py"
-""")
-
-    config = load_config(str(config_file))
-    loader = PluginLoader(config, mock_secrets)
-
-    plugins = loader.load_all()
-    assert "missing-plugin" not in plugins
-
-
-def test_unsupported_type(mock_secrets: SecretsProvider, tmp_path: Path) -> None:
-    """Test that unsupported plugin types are skipped."""
-    config_file = tmp_path / "bad_type.yaml"
-    config_file.write_text("""
-plugins:
-  - id: "openapi-plugin"
-    type: "openapi"
-    path: "spec.json"
-""")
-
-    config = load_config(str(config_file))
-    loader = PluginLoader(config, mock_secrets)
-
-    plugins = loader.load_all()
-    assert len(plugins) == 0
-
-
-def test_missing_path_field(mock_secrets: SecretsProvider, tmp_path: Path) -> None:
-    """Test that a plugin without a path raises ValueError internally and is skipped."""
-    config_file = tmp_path / "no_path.yaml"
-    config_file.write_text("""
-plugins:
-  - id: "no-path-plugin"
-    type: "local_python"
-    # missing path
-""")
+    assert "invalid-plugin" not in loaded_plugins
+
+
+@pytest.mark.parametrize(
+    "plugin_conf, patch_target, patch_kwargs",
+    [
+        (local_plugin("failing-plugin", "non_existent.py"), None, {}),
+        (PluginConfig(id="failing-plugin", type="openapi", path="spec.json"), None, {}),
+        (PluginConfig(id="failing-plugin", type="local_python"), None, {}),
+        (local_plugin("failing-plugin", "local_libs/crash_plugins/crash_on_load.py"), None, {}),
+        (local_plugin("failing-plugin", "local_libs/adapters/init_fail.py"), None, {}),
+        (
+            PluginConfig(id="failing-plugin", type="native"),
+            "importlib.import_module",
+            {"side_effect": ImportError("Not found")},
+        ),
+        (
+            PluginConfig(id="failing-plugin", type="native"),
+            "importlib.import_module",
+            {"side_effect": RuntimeError("Module crashed")},
+        ),
+    ],
+    ids=[
+        "missing-file",
+        "unsupported-type",
+        "missing-path",
+        "module-execution-failure",
+        "init-failure",
+        "native-not-found",
+        "native-runtime-error",
+    ],
+)
+def test_plugin_skipped_on_failure(
+    mock_secrets: SecretsProvider,
+    plugin_conf: PluginConfig,
+    patch_target: str | None,
+    patch_kwargs: dict[str, Any],
+) -> None:
+    """Test that a plugin which cannot be resolved, imported or instantiated is skipped."""
+    loader = PluginLoader(AppConfig(plugins=[plugin_conf]), mock_secrets)
+
+    with patch(patch_target, **patch_kwargs) if patch_target else nullcontext():
+        plugins = loader.load_all()
 
-    config = load_config(str(config_file))
-    loader = PluginLoader(config, mock_secrets)
-    plugins = loader.load_all()
-    assert "no-path-plugin" not in plugins
+    assert plugins == {}
 
 
-def test_import_spec_failure(mock_secrets: SecretsProvider, tmp_path: Path) -> None:
+def test_import_spec_failure(mock_secrets: SecretsProvider) -> None:
     """Test failure when importlib cannot create a spec."""
-    config_file = tmp_path / "bad_spec.yaml"
-
-    # Use a file inside safe zone
-    plugin_path = normalize_path(os.path.join("tests/fixtures/local_libs/crash_plugins/dummy.py"))
-
-    config_file.write_text(f"""
-plugins:
-  - id: "bad-spec-plugin"
-    type: "local_python"
-    path: "{plugin_path}"
-""")
-    config = load_config(str(config_file))
-    loader = PluginLoader(config, mock_secrets)
+    plugin_conf = local_plugin("bad-spec-plugin", "local_libs/crash_plugins/dummy.py")
+    loader = PluginLoader(AppConfig(), mock_secrets)
 
-    # Mock importlib.util.spec_from_file_location to return None
     with patch("importlib.util.spec_from_file_location", return_value=None):
-        plugins = loader.load_all()
-        assert "bad-spec-plugin" not in plugins
-
-
-def test_module_execution_failure(mock_secrets: SecretsProvider, tmp_path: Path) -> None:
-    """Test failure when module execution raises an exception."""
-    # Use a file inside safe zone
-    plugin_path = normalize_path(os.path.join("tests/fixtures/local_libs/crash_plugins/crash_on_load.py"))
-
-    config_file = tmp_path / "crash.yaml"
-    config_file.write_text(f"""
-plugins:
-  - id: "crasher"
-    type: "local_python"
-    path: "{plugin_path}"
-""")
-
-    config = load_config(str(config_file))
-    loader = PluginLoader(config, mock_secrets)
-
-    plugins = loader.load_all()
-    assert "crasher" not in plugins
+        with pytest.raises(ImportError, match="Could not create module spec"):
+            loader._resolve_local_python(plugin_conf)
 
 
 def test_unsafe_path(mock_secrets: SecretsProvider, tmp_path: Path) -> None:
@@ -189,52 +169,25 @@ def test_unsafe_path(mock_secrets: SecretsProvider, tmp_path: Path) -> None:
     unsafe_file = tmp_path / "unsafe.py"
     unsafe_file.write_text("pass")
 
-    # We can mock the config object.
-    from coreason_connect.config import AppConfig, PluginConfig
-
-    mock_plugin_conf = Mock(spec=PluginConfig)
-    mock_plugin_conf.id = "unsafe"
-    mock_plugin_conf.type = "local_python"
-    mock_plugin_conf.path = str(unsafe_file)
+    # model_construct skips the config-level safe zone validator so the loader's own check is exercised
+    unsafe_conf = PluginConfig.model_construct(id="unsafe", type="local_python", path=str(unsafe_file))
+    config = AppConfig(plugins=[unsafe_conf])
 
-    mock_config = Mock(spec=AppConfig)
-    mock_config.plugins = [mock_plugin_conf]
-
-    loader = PluginLoader(mock_config, mock_secrets)
+    loader = PluginLoader(config, mock_secrets)
     plugins = loader.load_all()
 
     assert "unsafe" not in plugins
 
 
-def test_mixed_plugins_resilience(mock_secrets: SecretsProvider, tmp_path: Path, fixtures_dir: str) -> None:
+def test_mixed_plugins_resilience(mock_secrets: SecretsProvider) -> None:
     """Test that valid plugins load even if others fail."""
-    # Create a mixed config
-    # 1. Valid plugin (from fixtures)
-    # 2. Init fail plugin (from fixtures)
-    # 3. Execution fail plugin (created here)
-
-    valid_path = normalize_path(os.path.join(fixtures_dir, "local_libs/adapters/valid_adapter.py"))
-    init_fail_path = normalize_path(os.path.join(fixtures_dir, "local_libs/adapters/init_fail.py"))
-
-    # We need a safe zone execution fail plugin
-    # existing fixture: tests/fixtures/local_libs/crash_plugins/crash_on_load.py
-    crash_path = normalize_path(os.path.join(fixtures_dir, "local_libs/crash_plugins/crash_on_load.py"))
-
-    config_file = tmp_path / "mixed.yaml"
-    config_file.write_text(f"""
-plugins:
-  - id: "valid"
-    type: "local_python"
-    path: "{valid_path}"
-  - id: "init-fail"
-    type: "local_python"
-    path: "{init_fail_path}"
-  - id: "crasher"
-    type: "local_python"
-    path: "{crash_path}"
-""")
-
-    config = load_config(str(config_file))
+    config = AppConfig(
+        plugins=[
+            local_plugin("valid", "local_libs/adapters/valid_adapter.py"),
+            local_plugin("init-fail", "local_libs/adapters/init_fail.py"),
+            local_plugin("crasher", "local_libs/crash_plugins/crash_on_load.py"),
+        ]
+    )
     loader = PluginLoader(config, mock_secrets)
 
     plugins = loader.load_all()
@@ -250,23 +203,50 @@ plugins:
     assert len(plugins) == 1
 
 
-def test_load_native_plugin(mock_secrets: SecretsProvider, tmp_path: Path) -> None:
+class MockNativePlugin(ConnectorProtocol):
+    def get_tools(self) -> list[ToolDefinition]:
+        return []
+
+    def execute(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any] | None = None,
+        user_context: Optional[UserContext] = None,
+    ) -> Any:
+        return "executed"
+
+
+def install_native_module(monkeypatch: pytest.MonkeyPatch, plugin_module: str, **members: Any) -> None:
+    """Register a real module under coreason_connect.plugins so import_module finds it in sys.modules."""
+    module = ModuleType(f"coreason_connect.plugins.{plugin_module}")
+    module.__dict__.update(members)
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+
+
+def test_load_native_plugin(mock_secrets: SecretsProvider, monkeypatch: pytest.MonkeyPatch) -> None:
     """Test loading a native plugin."""
-    config_file = tmp_path / "native.yaml"
-    config_file.write_text("""
-plugins:
-  - id: "test-native"
-    type: "native"
-""")
-
-    config = load_config(str(config_file))
+    install_native_module(monkeypatch, "test_native", MockNativePlugin=MockNativePlugin)
+    config = AppConfig(plugins=[PluginConfig(id="test-native", type="native")])
     loader = PluginLoader(config, mock_secrets)
 
-    # We need to mock importlib.import_module to return a dummy module
-    # containing a valid ConnectorProtocol implementation
-    from coreason_connect.interfaces import ConnectorProtocol, ToolDefinition
+    plugins = loader.load_all()
+
+    assert "test-native" in plugins
+    assert isinstance(plugins["test-native"], MockNativePlugin)
+
+
+def test_native_plugins_instantiated_concurrently(
+    mock_secrets: SecretsProvider, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that connector constructors overlap and results keep configuration order."""
+    # Both constructors must be running at the same time to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    class SlowInitPlugin(ConnectorProtocol):
+        def __init__(self, secrets: SecretsProvider) -> None:
+            super().__init__(secrets)
+            barrier.wait()
 
-    class MockNativePlugin(ConnectorProtocol):
         def get_tools(self) -> list[ToolDefinition]:
             return []
 
@@ -276,130 +256,97 @@ plugins:
             arguments: dict[str, Any] | None = None,
             user_context: Optional[UserContext] = None,
         ) -> Any:
-            return "executed"
+            return None
 
-    mock_module = Mock()
-    mock_module.MockNativePlugin = MockNativePlugin
+    install_native_module(monkeypatch, "first", SlowInitPlugin=SlowInitPlugin)
+    install_native_module(monkeypatch, "second", SlowInitPlugin=SlowInitPlugin)
+    config = AppConfig(plugins=[PluginConfig(id="first", type="native"), PluginConfig(id="second", type="native")])
 
-    with patch("importlib.import_module", return_value=mock_module) as mock_import:
-        plugins = loader.load_all()
+    plugins = PluginLoader(config, mock_secrets).load_all()
 
-        mock_import.assert_called_with("coreason_connect.plugins.test_native")
-        assert "test-native" in plugins
-        assert isinstance(plugins["test-native"], MockNativePlugin)
+    assert list(plugins) == ["first", "second"]
 
 
-def test_native_plugin_not_found(mock_secrets: SecretsProvider, tmp_path: Path) -> None:
-    """Test failure when native plugin module is missing."""
-    config_file = tmp_path / "native_missing.yaml"
-    config_file.write_text("""
-plugins:
-  - id: "missing-native"
-    type: "native"
-""")
+class ThreadRecordingPlugin(MockNativePlugin):
+    """Records the thread each instance was constructed on."""
 
-    config = load_config(str(config_file))
-    loader = PluginLoader(config, mock_secrets)
+    constructed_on: list[str] = []
 
-    with patch("importlib.import_module", side_effect=ImportError("Not found")):
-        plugins = loader.load_all()
-        assert "missing-native" not in plugins
+    def __init__(self, secrets: SecretsProvider) -> None:
+        super().__init__(secrets)
+        self.constructed_on.append(threading.current_thread().name)
 
 
-def test_native_plugin_runtime_error(mock_secrets: SecretsProvider, tmp_path: Path) -> None:
-    """Test resilience when a native plugin crashes during import."""
-    config_file = tmp_path / "native_crash.yaml"
-    config_file.write_text("""
-plugins:
-  - id: "crash-native"
-    type: "native"
-""")
+def test_native_plugins_constructed_inline_without_worker_threads(
+    mock_secrets: SecretsProvider, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that constructors run in the calling thread when no worker thread can be started."""
+    monkeypatch.setattr(ThreadRecordingPlugin, "constructed_on", [])
+    install_native_module(monkeypatch, "first", ThreadRecordingPlugin=ThreadRecordingPlugin)
+    install_native_module(monkeypatch, "second", ThreadRecordingPlugin=ThreadRecordingPlugin)
+    config = AppConfig(plugins=[PluginConfig(id="first", type="native"), PluginConfig(id="second", type="native")])
 
-    config = load_config(str(config_file))
-    loader = PluginLoader(config, mock_secrets)
+    with patch.object(ThreadPoolExecutor, "submit", side_effect=RuntimeError("can't start new thread")):
+        plugins = PluginLoader(config, mock_secrets).load_all()
 
-    with patch("importlib.import_module", side_effect=RuntimeError("Module crashed")):
-        plugins = loader.load_all()
-        assert "crash-native" not in plugins
+    assert list(plugins) == ["first", "second"]
+    assert ThreadRecordingPlugin.constructed_on == [threading.current_thread().name] * 2
 
 
-def test_native_plugin_no_connector(mock_secrets: SecretsProvider, tmp_path: Path) -> None:
-    """Test failure when native plugin module has no ConnectorProtocol."""
-    config_file = tmp_path / "native_empty.yaml"
-    config_file.write_text("""
-plugins:
-  - id: "empty-native"
-    type: "native"
-""")
-
-    config = load_config(str(config_file))
-    loader = PluginLoader(config, mock_secrets)
+def test_native_plugins_constructed_once_when_submit_fails_midway(
+    mock_secrets: SecretsProvider, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a submit failure after some work was queued constructs every connector exactly once."""
+    monkeypatch.setattr(ThreadRecordingPlugin, "constructed_on", [])
+    install_native_module(monkeypatch, "first", ThreadRecordingPlugin=ThreadRecordingPlugin)
+    install_native_module(monkeypatch, "second", ThreadRecordingPlugin=ThreadRecordingPlugin)
+    config = AppConfig(plugins=[PluginConfig(id="first", type="native"), PluginConfig(id="second", type="native")])
+    real_submit = ThreadPoolExecutor.submit
+    calls = 0
 
-    # Mock module with no classes
-    mock_module = Mock()
-    # Ensure inspect.getmembers returns nothing useful
-    mock_module.SomeClass = type("SomeClass", (), {})
+    def submit_once(executor: ThreadPoolExecutor, fn: Any, *args: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            raise RuntimeError("can't start new thread")
+        return real_submit(executor, fn, *args)
 
-    with patch("importlib.import_module", return_value=mock_module):
-        plugins = loader.load_all()
-        assert "empty-native" not in plugins
+    with patch.object(ThreadPoolExecutor, "submit", autospec=True, side_effect=submit_once):
+        plugins = PluginLoader(config, mock_secrets).load_all()
 
+    assert list(plugins) == ["first", "second"]
+    assert len(ThreadRecordingPlugin.constructed_on) == 2
 
-def test_native_plugin_normalization(mock_secrets: SecretsProvider, tmp_path: Path) -> None:
-    """Test that plugin ID normalization works correctly."""
-    config_file = tmp_path / "native_norm.yaml"
-    config_file.write_text("""
-plugins:
-  - id: "my-cool-plugin"
-    type: "native"
-""")
-
-    config = load_config(str(config_file))
-    loader = PluginLoader(config, mock_secrets)
 
-    from coreason_connect.interfaces import ConnectorProtocol, ToolDefinition
+def test_native_plugin_no_connector(mock_secrets: SecretsProvider, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test failure when native plugin module has no ConnectorProtocol."""
+    # A module whose only class is not a connector
+    install_native_module(monkeypatch, "empty_native", SomeClass=type("SomeClass", (), {}))
+    loader = PluginLoader(AppConfig(), mock_secrets)
 
-    class MockPlugin(ConnectorProtocol):
-        def get_tools(self) -> list[ToolDefinition]:
-            return []
+    with pytest.raises(ValueError, match="No ConnectorProtocol implementation found"):
+        loader._resolve_native(PluginConfig(id="empty-native", type="native"))
 
-        def execute(
-            self,
-            tool_name: str,
-            arguments: dict[str, Any] | None = None,
-            user_context: Optional[UserContext] = None,
-        ) -> Any:
-            return "ok"
 
-    mock_module = Mock()
-    mock_module.Plugin = MockPlugin
+def test_native_plugin_normalization(mock_secrets: SecretsProvider, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that plugin ID normalization works correctly."""
+    # Only 'coreason_connect.plugins.my_cool_plugin' exists, so resolving proves the normalized name was used
+    install_native_module(monkeypatch, "my_cool_plugin", Plugin=MockNativePlugin)
+    loader = PluginLoader(AppConfig(), mock_secrets)
 
-    with patch("importlib.import_module", return_value=mock_module) as mock_import:
-        plugins = loader.load_all()
+    connector_class = loader._resolve_native(PluginConfig(id="my-cool-plugin", type="native"))
 
-        # The key check: ensure it tried to import 'coreason_connect.plugins.my_cool_plugin'
-        mock_import.assert_called_with("coreason_connect.plugins.my_cool_plugin")
-        assert "my-cool-plugin" in plugins
+    assert connector_class is MockNativePlugin
 
 
-def test_isolation_class_names(mock_secrets: SecretsProvider, tmp_path: Path, fixtures_dir: str) -> None:
+def test_isolation_class_names(mock_secrets: SecretsProvider) -> None:
     """Test loading two plugins with the same class name but different IDs."""
-
-    path1 = normalize_path(os.path.join(fixtures_dir, "local_libs/adapters/valid_adapter.py"))
-    path2 = normalize_path(os.path.join(fixtures_dir, "local_libs/adapters/duplicate_class.py"))
-
-    config_file = tmp_path / "collision.yaml"
-    config_file.write_text(f"""
-plugins:
-  - id: "first"
-    type: "local_python"
-    path: "{path1}"
-  - id: "second"
-    type: "local_python"
-    path: "{path2}"
-""")
-
-    config = load_config(str(config_file))
+    config = AppConfig(
+        plugins=[
+            local_plugin("first", "local_libs/adapters/valid_adapter.py"),
+            local_plugin("second", "local_libs/adapters/duplicate_class.py"),
+        ]
+    )
     loader = PluginLoader(config, mock_secrets)
 
     plugins = loader.load_all()
@@ -420,51 +367,13 @@ plugins:
     assert obj2.execute("any") == "duplicate"  # From duplicate_class.py
 
 
-def test_sys_path_hygiene(mock_secrets: SecretsProvider, tmp_path: Path, fixtures_dir: str) -> None:
-    """Verify sys.path is clean after a plugin crash."""
-    crash_path = normalize_path(os.path.join(fixtures_dir, "local_libs/crash_plugins/crash_on_load.py"))
-
-    # The expected temporary path is .../tests/fixtures/local_libs/crash_plugins/.. -> crash_plugins
-    # Wait, the logic is parent.parent.
-    # crash_plugins/crash_on_load.py -> parent: crash_plugins -> parent: local_libs
-
-    lib_root = str(Path(crash_path).resolve().parent.parent)
-
-    config_file = tmp_path / "hygiene.yaml"
-    config_file.write_text(f"""
-plugins:
-  - id: "crasher"
-    type: "local_python"
-    path: "{crash_path}"
-""")
-
-    config = load_config(str(config_file))
+def test_sys_path_hygiene(mock_secrets: SecretsProvider) -> None:
+    """Verify sys.path is unchanged after a plugin crash."""
+    config = AppConfig(plugins=[local_plugin("crasher", "local_libs/crash_plugins/crash_on_load.py")])
     loader = PluginLoader(config, mock_secrets)
 
-    # Ensure it's not there before
-    assert lib_root not in sys.path
-
+    before = list(sys.path)
     loader.load_all()
 
-    # Ensure it's not there after
-    assert lib_root not in sys.path
-
-
-def test_init_failure(mock_secrets: SecretsProvider, tmp_path: Path, fixtures_dir: str) -> None:
-    """Test plugin that fails during __init__."""
-    init_fail_path = normalize_path(os.path.join(fixtures_dir, "local_libs/adapters/init_fail.py"))
-
-    config_file = tmp_path / "init_fail.yaml"
-    config_file.write_text(f"""
-plugins:
-  - id: "init-fail"
-    type: "local_python"
-    path: "{init_fail_path}"
-""")
-
-    config = load_config(str(config_file))
-    loader = PluginLoader(config, mock_secrets)
-
-    plugins = loader.load_all()
-
-    assert "init-fail" not in plugins
+    # The plugin's library root is added only for the duration of the import
+    assert sys.path == before
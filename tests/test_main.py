@@ -9,7 +9,7 @@
 # Source Code: https://github.com/CoReason-AI/coreason_connect
 
 import asyncio
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -17,43 +17,41 @@ from coreason_connect.main import hello_world, main
 
 
 @pytest.mark.asyncio
-async def test_hello_world() -> None:
+async def test_hello_world(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that hello_world initializes server and handles cancellation."""
     # Mock AppConfig and CoreasonConnectServiceAsync to avoid side effects
-    with (
-        patch("coreason_connect.main.AppConfig") as MockConfig,
-        patch("coreason_connect.main.CoreasonConnectServiceAsync") as MockServer,
-        patch("asyncio.sleep", side_effect=asyncio.CancelledError) as mock_sleep,
-    ):
-        mock_server_instance = MockServer.return_value
-        mock_server_instance.name = "TestServer"
-        mock_server_instance.version = "0.0.0"
-
-        # Setup async context manager mock
-        mock_server_instance.__aenter__.return_value = mock_server_instance
-        mock_server_instance.__aexit__.return_value = None
-
-        # Run hello_world, which should catch CancelledError and exit
-        await hello_world()
-
-        # Verification
-        MockConfig.assert_called_once()
-        MockServer.assert_called_once()
-        mock_server_instance.__aenter__.assert_called_once()
-        mock_server_instance.__aexit__.assert_called_once()
-        mock_sleep.assert_called_once()
-
-
-def test_main() -> None:
-    """Test the main entry point."""
-    with patch("coreason_connect.main.asyncio.run") as mock_run:
-        main()
-        mock_run.assert_called_once()
-
-
-def test_main_keyboard_interrupt() -> None:
-    """Test that main handles KeyboardInterrupt gracefully."""
-    with patch("coreason_connect.main.asyncio.run", side_effect=KeyboardInterrupt) as mock_run:
+    MockConfig = MagicMock()
+    MockServer = MagicMock()
+    mock_sleep = AsyncMock(side_effect=asyncio.CancelledError)
+    monkeypatch.setattr("coreason_connect.main.AppConfig", MockConfig)
+    monkeypatch.setattr("coreason_connect.main.CoreasonConnectServiceAsync", MockServer)
+    monkeypatch.setattr("asyncio.sleep", mock_sleep)
+
+    mock_server_instance = MockServer.return_value
+    mock_server_instance.name = "TestServer"
+    mock_server_instance.version = "0.0.0"
+
+    # Setup async context manager mock
+    mock_server_instance.__aenter__.return_value = mock_server_instance
+    mock_server_instance.__aexit__.return_value = None
+
+    # Run hello_world, which should catch CancelledError and exit
+    await hello_world()
+
+    # Verification
+    MockConfig.assert_called_once()
+    MockServer.assert_called_once()
+    mock_server_instance.__aenter__.assert_called_once()
+    mock_server_instance.__aexit__.assert_called_once()
+    mock_sleep.assert_called_once()
+
+
+@pytest.mark.parametrize("side_effect", [None, KeyboardInterrupt], ids=["normal", "keyboard-interrupt"])
+def test_main(side_effect: type[BaseException] | None) -> None:
+    """Test the main entry point, including that it handles KeyboardInterrupt gracefully."""
+    with patch("coreason_connect.main.asyncio.run", side_effect=side_effect) as mock_run:
         # Should not raise exception
         main()
-        mock_run.assert_called_once()
+    mock_run.assert_called_once()
+    # The patched run never awaits the coroutine; close it so it is not reported as leaked
+    mock_run.call_args.args[0].close()
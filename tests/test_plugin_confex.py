@@ -10,6 +10,7 @@
 
 import json
 import os
+from typing import Generator
 
 import pytest
 
@@ -22,22 +23,25 @@ FIXTURES_DIR = os.path.dirname(os.path.abspath(__file__)) + "/fixtures"
 LOCAL_LIBS_DIR = os.path.join(FIXTURES_DIR, "local_libs")
 CONFEX_ADAPTER_PATH = os.path.join(LOCAL_LIBS_DIR, "adapters/confex_adapter.py")
 
+# Built once; EnvSecretsProvider reads the environment on each lookup, so it is safe to share
+_CONFEX_APP_CONFIG = AppConfig(
+    plugins=[
+        PluginConfig(id="confex", type="local_python", path=CONFEX_ADAPTER_PATH, description="Conference Intelligence")
+    ]
+)
+_CONFEX_SECRETS = EnvSecretsProvider()
 
-@pytest.fixture
-def confex_server(monkeypatch: pytest.MonkeyPatch) -> CoreasonConnectServiceAsync:
-    """Create a server instance with the Confex plugin loaded."""
-    # Ensure environment has secret
-    monkeypatch.setenv("CONFEX_API_KEY", "test-key-123")
 
-    config = AppConfig(
-        plugins=[
-            PluginConfig(
-                id="confex", type="local_python", path=CONFEX_ADAPTER_PATH, description="Conference Intelligence"
-            )
-        ]
-    )
-    secrets = EnvSecretsProvider()
-    return CoreasonConnectServiceAsync(config=config, secrets=secrets)
+@pytest.fixture(scope="module")
+def confex_server() -> Generator[CoreasonConnectServiceAsync, None, None]:
+    """Create a server instance with the Confex plugin loaded, shared by the module's read-only tests."""
+    with pytest.MonkeyPatch.context() as mp:
+        # Ensure environment has secret while the adapter reads it during loading
+        mp.setenv("CONFEX_API_KEY", "test-key-123")
+
+        server = CoreasonConnectServiceAsync(config=_CONFEX_APP_CONFIG, secrets=_CONFEX_SECRETS)
+        server.ensure_plugins_loaded()
+        yield server
 
 
 @pytest.mark.asyncio
@@ -106,17 +110,9 @@ async def test_initialization_without_api_key(monkeypatch: pytest.MonkeyPatch) -
     # Remove the key
     monkeypatch.delenv("CONFEX_API_KEY", raising=False)
 
-    config = AppConfig(
-        plugins=[
-            PluginConfig(
-                id="confex", type="local_python", path=CONFEX_ADAPTER_PATH, description="Conference Intelligence"
-            )
-        ]
-    )
-    secrets = EnvSecretsProvider()
-
     # This should not raise an exception
-    server = CoreasonConnectServiceAsync(config=config, secrets=secrets)
+    server = CoreasonConnectServiceAsync(config=_CONFEX_APP_CONFIG, secrets=_CONFEX_SECRETS)
+    server.ensure_plugins_loaded()
     assert "confex" in server.plugins
 
     # Tools should still work (mock client doesn't check key strictly, but we verify it doesn't crash)
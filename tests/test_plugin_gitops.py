@@ -8,8 +8,9 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_connect
 
-from typing import Any
-from unittest.mock import MagicMock, Mock
+import json
+from typing import Any, Generator
+from unittest.mock import MagicMock
 
 import httpx
 import pytest
@@ -18,22 +19,64 @@ from coreason_connect.interfaces import SecretsProvider
 from coreason_connect.plugins.gitops import GitOpsConnector
 from coreason_connect.types import ToolExecutionError
 
+PR_PATH = "/repos/owner/repo/pulls"
+CHECK_RUNS_PATH = "/repos/owner/repo/commits/abcdef123456/check-runs"
 
-@pytest.fixture
+# Scripted GitHub responses keyed by (method, path), and the requests the connector sent
+_RESPONSES: dict[tuple[str, str], httpx.Response | Exception] = {}
+_REQUESTS: list[httpx.Request] = []
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    _REQUESTS.append(request)
+    response = _RESPONSES[(request.method, request.url.path)]
+    if isinstance(response, Exception):
+        raise response
+    return response
+
+
+def respond(method: str, path: str, status_code: int = 200, **kwargs: Any) -> None:
+    """Script the response the mock GitHub API returns for a request."""
+    _RESPONSES[(method, path)] = httpx.Response(status_code, **kwargs)
+
+
+@pytest.fixture(scope="module")
 def mock_secrets() -> MagicMock:
     secrets = MagicMock(spec=SecretsProvider)
     secrets.get_secret.return_value = "mock_token"
     return secrets
 
 
-@pytest.fixture
-def gitops_plugin(mock_secrets: MagicMock) -> GitOpsConnector:
-    return GitOpsConnector(secrets=mock_secrets)
+@pytest.fixture(scope="module")
+def gitops_plugin(mock_secrets: MagicMock) -> Generator[GitOpsConnector, None, None]:
+    plugin = GitOpsConnector(secrets=mock_secrets)
+    # Route the connector's requests to the scripted responses instead of the network
+    plugin.client.close()
+    plugin.client = httpx.Client(
+        base_url=plugin.base_url, headers=plugin.headers, transport=httpx.MockTransport(_handler)
+    )
+    yield plugin
+    plugin.client.close()
 
 
-def test_initialization(gitops_plugin: GitOpsConnector) -> None:
-    assert gitops_plugin.token == "mock_token"
-    assert isinstance(gitops_plugin.client, httpx.Client)
+@pytest.fixture(autouse=True)
+def reset_responses() -> Generator[None, None, None]:
+    """Forget the scripted responses and recorded requests after each test."""
+    yield
+    _RESPONSES.clear()
+    _REQUESTS.clear()
+
+
+def test_initialization(mock_secrets: MagicMock) -> None:
+    # A connector of its own, since gitops_plugin's client is replaced by the fixture
+    plugin = GitOpsConnector(secrets=mock_secrets)
+    try:
+        assert plugin.token == "mock_token"
+        assert isinstance(plugin.client, httpx.Client)
+        assert plugin.client.base_url == "https://api.github.com"
+        assert plugin.client.headers["Authorization"] == "Bearer mock_token"
+    finally:
+        plugin.client.close()
 
 
 def test_get_tools(gitops_plugin: GitOpsConnector) -> None:
@@ -49,13 +92,7 @@ def test_get_tools(gitops_plugin: GitOpsConnector) -> None:
 
 
 def test_create_pr_success(gitops_plugin: GitOpsConnector) -> None:
-    # Mock the httpx client
-    mock_response = Mock()
-    mock_response.status_code = 201
-    mock_response.json.return_value = {"html_url": "https://github.com/owner/repo/pull/1"}
-    mock_response.raise_for_status = Mock()
-
-    gitops_plugin.client.post = Mock(return_value=mock_response)  # type: ignore
+    respond("POST", PR_PATH, 201, json={"html_url": "https://github.com/owner/repo/pull/1"})
 
     args = {
         "repo": "owner/repo",
@@ -66,11 +103,11 @@ def test_create_pr_success(gitops_plugin: GitOpsConnector) -> None:
     result = gitops_plugin.execute("git_create_pr", args)
 
     assert result["html_url"] == "https://github.com/owner/repo/pull/1"
-    gitops_plugin.client.post.assert_called_once()
-    call_args = gitops_plugin.client.post.call_args
-    assert call_args[0][0] == "/repos/owner/repo/pulls"
-    assert call_args[1]["json"]["title"] == "Fix bug"
-    assert call_args[1]["json"]["head"] == "feature-branch"
+    assert len(_REQUESTS) == 1
+    assert _REQUESTS[0].url.path == PR_PATH
+    payload = json.loads(_REQUESTS[0].content)
+    assert payload["title"] == "Fix bug"
+    assert payload["head"] == "feature-branch"
 
 
 def test_create_pr_missing_args(gitops_plugin: GitOpsConnector) -> None:
@@ -80,16 +117,8 @@ def test_create_pr_missing_args(gitops_plugin: GitOpsConnector) -> None:
 
 
 def test_create_pr_api_error(gitops_plugin: GitOpsConnector) -> None:
-    # Mock failure
-    mock_response = Mock()
-    mock_response.status_code = 422
-    mock_response.text = "Validation Failed"
-
-    # raise_for_status should raise an HTTPStatusError
-    error = httpx.HTTPStatusError("422 Client Error", request=Mock(), response=mock_response)
-    mock_response.raise_for_status.side_effect = error
-
-    gitops_plugin.client.post = Mock(return_value=mock_response)  # type: ignore
+    # raise_for_status raises an HTTPStatusError for the 422
+    respond("POST", PR_PATH, 422, text="Validation Failed")
 
     args = {
         "repo": "owner/repo",
@@ -107,26 +136,26 @@ def test_create_pr_api_error(gitops_plugin: GitOpsConnector) -> None:
 
 def test_get_build_logs_success(gitops_plugin: GitOpsConnector) -> None:
     # Mock response
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "check_runs": [
-            {
-                "status": "completed",
-                "conclusion": "failure",
-                "name": "build",
-                "output": {"summary": "Error: build failed"},
-            },
-            {
-                "status": "completed",
-                "conclusion": "success",
-                "name": "lint",
-            },
-        ]
-    }
-    mock_response.raise_for_status = Mock()
-
-    gitops_plugin.client.get = Mock(return_value=mock_response)  # type: ignore
+    respond(
+        "GET",
+        CHECK_RUNS_PATH,
+        200,
+        json={
+            "check_runs": [
+                {
+                    "status": "completed",
+                    "conclusion": "failure",
+                    "name": "build",
+                    "output": {"summary": "Error: build failed"},
+                },
+                {
+                    "status": "completed",
+                    "conclusion": "success",
+                    "name": "lint",
+                },
+            ]
+        },
+    )
 
     args = {"repo": "owner/repo", "commit_sha": "abcdef123456"}
     result = gitops_plugin.execute("git_get_build_logs", args)
@@ -152,7 +181,7 @@ def test_init_missing_token() -> None:
 
 
 def test_execute_generic_error(gitops_plugin: GitOpsConnector) -> None:
-    gitops_plugin.client.post = Mock(side_effect=Exception("Boom"))  # type: ignore
+    _RESPONSES[("POST", "/repos/a/pulls")] = Exception("Boom")
 
     with pytest.raises(ToolExecutionError) as excinfo:
         gitops_plugin.execute("git_create_pr", {"repo": "a", "branch": "b", "title": "c", "changes": "d"})
@@ -167,19 +196,20 @@ def test_get_build_logs_missing_args(gitops_plugin: GitOpsConnector) -> None:
 
 
 def test_get_build_logs_no_failures(gitops_plugin: GitOpsConnector) -> None:
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "check_runs": [
-            {
-                "status": "completed",
-                "conclusion": "success",
-                "name": "build",
-            }
-        ]
-    }
-    mock_response.raise_for_status = Mock()
-    gitops_plugin.client.get = Mock(return_value=mock_response)  # type: ignore
+    respond(
+        "GET",
+        CHECK_RUNS_PATH,
+        200,
+        json={
+            "check_runs": [
+                {
+                    "status": "completed",
+                    "conclusion": "success",
+                    "name": "build",
+                }
+            ]
+        },
+    )
 
     args = {"repo": "owner/repo", "commit_sha": "abcdef123456"}
     result = gitops_plugin.execute("git_get_build_logs", args)
@@ -197,12 +227,7 @@ def test_create_pr_empty_strings(gitops_plugin: GitOpsConnector) -> None:
 
 def test_get_build_logs_malformed_response(gitops_plugin: GitOpsConnector) -> None:
     """Test handling of unexpected API response structure."""
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {}  # Missing "check_runs"
-    mock_response.raise_for_status = Mock()
-
-    gitops_plugin.client.get = Mock(return_value=mock_response)  # type: ignore
+    respond("GET", CHECK_RUNS_PATH, 200, json={})  # Missing "check_runs"
 
     args = {"repo": "owner/repo", "commit_sha": "abcdef123456"}
     result = gitops_plugin.execute("git_get_build_logs", args)
@@ -214,21 +239,21 @@ def test_get_build_logs_malformed_response(gitops_plugin: GitOpsConnector) -> No
 
 def test_get_build_logs_null_output(gitops_plugin: GitOpsConnector) -> None:
     """Test check run with missing or null output."""
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "check_runs": [
-            {
-                "status": "completed",
-                "conclusion": "failure",
-                "name": "build_without_logs",
-                "output": None,  # Null output
-            }
-        ]
-    }
-    mock_response.raise_for_status = Mock()
-
-    gitops_plugin.client.get = Mock(return_value=mock_response)  # type: ignore
+    respond(
+        "GET",
+        CHECK_RUNS_PATH,
+        200,
+        json={
+            "check_runs": [
+                {
+                    "status": "completed",
+                    "conclusion": "failure",
+                    "name": "build_without_logs",
+                    "output": None,  # Null output
+                }
+            ]
+        },
+    )
 
     args = {"repo": "owner/repo", "commit_sha": "abcdef123456"}
     result = gitops_plugin.execute("git_get_build_logs", args)
@@ -238,37 +263,28 @@ def test_get_build_logs_null_output(gitops_plugin: GitOpsConnector) -> None:
     assert result["logs"][0]["output"] == "No summary available"
 
 
-def test_get_build_logs_complex_scenario(gitops_plugin: GitOpsConnector) -> None:
-    """Test a large response with mixed statuses and robust parsing."""
-    check_runs: list[dict[str, Any]] = []
-    # 50 passing runs
-    for i in range(50):
-        check_runs.append({"status": "completed", "conclusion": "success", "name": f"test_{i}"})
-
-    # 2 failures
-    check_runs.append(
-        {
-            "status": "completed",
-            "conclusion": "failure",
-            "name": "integration_test",
-            "output": {"summary": "Failed to connect to DB"},
-        }
-    )
-    check_runs.append(
-        {
-            "status": "completed",
-            "conclusion": "timed_out",  # Should be treated as failure? Code currently checks for "failure" explicitly
-            "name": "e2e_test",
-            "output": {"summary": "Timeout"},
-        }
-    )
+# 50 passing runs followed by 2 failures, built once at import
+_COMPLEX_CHECK_RUNS: tuple[dict[str, Any], ...] = tuple(
+    {"status": "completed", "conclusion": "success", "name": f"test_{i}"} for i in range(50)
+) + (
+    {
+        "status": "completed",
+        "conclusion": "failure",
+        "name": "integration_test",
+        "output": {"summary": "Failed to connect to DB"},
+    },
+    {
+        "status": "completed",
+        "conclusion": "timed_out",  # Should be treated as failure? Code currently checks for "failure" explicitly
+        "name": "e2e_test",
+        "output": {"summary": "Timeout"},
+    },
+)
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"check_runs": check_runs}
-    mock_response.raise_for_status = Mock()
 
-    gitops_plugin.client.get = Mock(return_value=mock_response)  # type: ignore
+def test_get_build_logs_complex_scenario(gitops_plugin: GitOpsConnector) -> None:
+    """Test a large response with mixed statuses and robust parsing."""
+    respond("GET", CHECK_RUNS_PATH, 200, json={"check_runs": list(_COMPLEX_CHECK_RUNS)})
 
     args = {"repo": "owner/repo", "commit_sha": "abcdef123456"}
     result = gitops_plugin.execute("git_get_build_logs", args)
@@ -283,12 +299,7 @@ def test_get_build_logs_complex_scenario(gitops_plugin: GitOpsConnector) -> None
 
 def test_create_pr_unexpected_response(gitops_plugin: GitOpsConnector) -> None:
     """Test create_pr where API returns success but unexpected JSON."""
-    mock_response = Mock()
-    mock_response.status_code = 201
-    mock_response.json.return_value = {"something": "else"}
-    mock_response.raise_for_status = Mock()
-
-    gitops_plugin.client.post = Mock(return_value=mock_response)  # type: ignore
+    respond("POST", PR_PATH, 201, json={"something": "else"})
 
     args = {
         "repo": "owner/repo",
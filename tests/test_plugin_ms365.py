@@ -8,7 +8,7 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_connect
 
-from typing import Generator
+from typing import Any, Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -18,14 +18,15 @@ from httpx import HTTPStatusError, Request, Response
 from coreason_connect.interfaces import SecretsProvider
 from coreason_connect.plugins.ms365 import MS365Connector
 from coreason_connect.types import ToolExecutionError
+from tests.fixtures.mock_secrets import MockSecrets
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_secrets() -> SecretsProvider:
-    return MagicMock(spec=SecretsProvider)
+    return MockSecrets()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_graph_client() -> Generator[MagicMock, None, None]:
     with patch("coreason_connect.plugins.ms365.GraphClientFactory.create_with_default_middleware") as mock_factory:
         mock_client = MagicMock()
@@ -33,11 +34,17 @@ def mock_graph_client() -> Generator[MagicMock, None, None]:
         yield mock_client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def connector(mock_secrets: SecretsProvider, mock_graph_client: MagicMock) -> MS365Connector:
     return MS365Connector(mock_secrets)
 
 
+@pytest.fixture(autouse=True)
+def reset_graph_client(mock_graph_client: MagicMock) -> None:
+    """Clear recorded calls and configured responses between tests."""
+    mock_graph_client.reset_mock(return_value=True, side_effect=True)
+
+
 def test_init_failure(mock_secrets: SecretsProvider) -> None:
     with patch(
         "coreason_connect.plugins.ms365.GraphClientFactory.create_with_default_middleware",
@@ -100,21 +107,50 @@ def test_send_email(connector: MS365Connector, mock_graph_client: MagicMock) ->
     assert args[0] == "/me/messages/123/send"
 
 
-def test_send_email_missing_id(connector: MS365Connector) -> None:
-    with pytest.raises(ToolExecutionError, match="Message ID is required"):
-        connector.execute("send_email", {})
-
-
-def test_execute_unknown_tool(connector: MS365Connector) -> None:
-    with pytest.raises(ToolExecutionError, match="Unknown tool: unknown"):
-        connector.execute("unknown", {})
-
-
-def test_execute_failure(connector: MS365Connector, mock_graph_client: MagicMock) -> None:
-    mock_graph_client.post.side_effect = Exception("API Error")
-
-    with pytest.raises(ToolExecutionError, match="MS365 error: API Error"):
-        connector.execute("send_email", {"id": "123"})
+# A 401 Unauthorized surfaced by raise_for_status() on the returned response object
+_UNAUTHORIZED_REQUEST = Request("POST", "https://graph.microsoft.com/v1.0/me/messages")
+_UNAUTHORIZED_ERROR = HTTPStatusError(
+    "401 Unauthorized",
+    request=_UNAUTHORIZED_REQUEST,
+    response=Response(401, request=_UNAUTHORIZED_REQUEST, text="Unauthorized"),
+)
+
+
+@pytest.mark.parametrize(
+    "tool_name, arguments, post_config, match",
+    [
+        ("send_email", {}, {}, "Message ID is required"),
+        ("unknown", {}, {}, "Unknown tool: unknown"),
+        ("send_email", {"id": "123"}, {"side_effect": Exception("API Error")}, "MS365 error: API Error"),
+        (
+            "send_email",
+            {"id": "123"},
+            {"return_value": MagicMock(**{"raise_for_status.side_effect": _UNAUTHORIZED_ERROR})},
+            "MS365 error: 401 Unauthorized",
+        ),
+        (
+            # json() raising ValueError simulates malformed JSON body
+            "draft_email",
+            {"to": "a", "subject": "b", "body": "c"},
+            {"return_value": MagicMock(**{"json.side_effect": ValueError("Expecting value")})},
+            "MS365 error: Expecting value",
+        ),
+    ],
+    ids=["send-email-missing-id", "unknown-tool", "execute-failure", "api-http-error", "api-malformed-response"],
+)
+def test_execute_error(
+    connector: MS365Connector,
+    mock_graph_client: MagicMock,
+    tool_name: str,
+    arguments: dict[str, Any],
+    post_config: dict[str, Any],
+    match: str,
+) -> None:
+    """Test that validation, unknown-tool and Graph API failures surface as ToolExecutionError."""
+    mock_graph_client.post.configure_mock(**post_config)
+
+    with pytest.raises(ToolExecutionError, match=match):
+        connector.execute(tool_name, arguments)
 
 
 # --- Edge Case Tests ---
@@ -133,36 +169,6 @@ def test_find_meeting_slot_empty_attendees(connector: MS365Connector, mock_graph
     assert kwargs["json"]["attendees"] == []
 
 
-def test_api_http_error(connector: MS365Connector, mock_graph_client: MagicMock) -> None:
-    """Test handling of HTTP error codes."""
-    # Simulate a 401 Unauthorized
-    request = Request("POST", "https://graph.microsoft.com/v1.0/me/messages")
-    response = Response(401, request=request, text="Unauthorized")
-    error = HTTPStatusError("401 Unauthorized", request=request, response=response)
-
-    # We must mock raise_for_status to raise this error,
-    # OR mock the side_effect of the post call if the client raises it immediately.
-    # The current implementation calls raise_for_status() on the returned response object.
-
-    mock_response_obj = MagicMock()
-    mock_response_obj.raise_for_status.side_effect = error
-    mock_graph_client.post.return_value = mock_response_obj
-
-    with pytest.raises(ToolExecutionError, match="MS365 error: 401 Unauthorized"):
-        connector.execute("send_email", {"id": "123"})
-
-
-def test_api_malformed_response(connector: MS365Connector, mock_graph_client: MagicMock) -> None:
-    """Test when API returns invalid JSON."""
-    mock_response = MagicMock()
-    # json() raising ValueError simulates malformed JSON body
-    mock_response.json.side_effect = ValueError("Expecting value")
-    mock_graph_client.post.return_value = mock_response
-
-    with pytest.raises(ToolExecutionError, match="MS365 error: Expecting value"):
-        connector.execute("draft_email", {"to": "a", "subject": "b", "body": "c"})
-
-
 def test_complex_scenario_chain(connector: MS365Connector, mock_graph_client: MagicMock) -> None:
     """
     Simulate a chain: find slot -> draft email -> send email.
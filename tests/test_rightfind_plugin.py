@@ -8,13 +8,18 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_connect
 
-import os
+from pathlib import Path
 
 import pytest
+from mcp.types import Tool
 
 from coreason_connect.config import AppConfig, PluginConfig
 from coreason_connect.interfaces import SecretsProvider
 from coreason_connect.server import CoreasonConnectServiceAsync
+from coreason_connect.types import ToolDefinition
+
+# Path to the fixture adapter, resolved once and independent of the working directory
+ADAPTER_PATH = str(Path(__file__).resolve().parent / "fixtures" / "local_libs" / "adapters" / "rf_adapter.py")
 
 
 # Mock secrets provider
@@ -26,36 +31,43 @@ class MockSecrets(SecretsProvider):
         return "user_cred"
 
 
-@pytest.mark.asyncio
-async def test_rightfind_plugin_loading_and_execution() -> None:
-    """
-    Integration test for the RightFind adapter.
-    Verifies:
-    1. Plugin loading from disk.
-    2. Sibling import injection (import rightfind_client).
-    3. Tool registration.
-    4. Execution of standard tools.
-    5. Execution of consequential tools (Spend Gate).
-    6. Error handling.
-    """
+# Neither secrets provider holds state, so one instance of each serves the module
+_MOCK_SECRETS = MockSecrets()
 
-    # Path to the fixture adapter
-    cwd = os.getcwd()
-    adapter_path = os.path.join(cwd, "tests/fixtures/local_libs/adapters/rf_adapter.py")
 
+@pytest.fixture(scope="module")
+def rightfind_server() -> CoreasonConnectServiceAsync:
+    """Create a server instance with the RightFind plugin loaded, shared by the module's read-only tests."""
     config = AppConfig(
         plugins=[
             PluginConfig(
                 id="rightfind",
                 type="local_python",
-                path=adapter_path,
+                path=ADAPTER_PATH,
                 description="RightFind Adapter Fixture",
             )
         ]
     )
 
-    secrets = MockSecrets()
-    server = CoreasonConnectServiceAsync(config=config, secrets=secrets)
+    server = CoreasonConnectServiceAsync(config=config, secrets=_MOCK_SECRETS)
+    server.ensure_plugins_loaded()
+    return server
+
+
+@pytest.mark.asyncio
+async def test_rightfind_plugin_loading_and_execution(rightfind_server: CoreasonConnectServiceAsync) -> None:
+    """
+    Integration test for the RightFind adapter.
+    Verifies:
+    1. Plugin loading from disk.
+    2. Sibling import injection (import rightfind_client).
+    3. Tool registration.
+    4. Execution of standard tools.
+    5. Execution of consequential tools (Spend Gate).
+    6. Error handling.
+    """
+
+    server = rightfind_server
 
     # Verify plugin loaded
     assert "rightfind" in server.plugins
@@ -94,28 +106,26 @@ class BrokenSecrets(SecretsProvider):
         raise ValueError("User credential access denied")
 
 
+_BROKEN_SECRETS = BrokenSecrets()
+
+
 @pytest.mark.asyncio
 async def test_plugin_init_failure_missing_secrets() -> None:
     """Test that the server handles plugin initialization failure gracefully."""
-    cwd = os.getcwd()
-    adapter_path = os.path.join(cwd, "tests/fixtures/local_libs/adapters/rf_adapter.py")
-
     config = AppConfig(
         plugins=[
             PluginConfig(
                 id="rightfind_broken",
                 type="local_python",
-                path=adapter_path,
+                path=ADAPTER_PATH,
                 description="Broken Secrets Plugin",
             )
         ]
     )
 
-    # Secrets provider that raises on access (used in adapter __init__)
-    secrets = BrokenSecrets()
-
-    # The server should catch the exception during loading
-    server = CoreasonConnectServiceAsync(config=config, secrets=secrets)
+    # The server should catch the exception the secrets provider raises in the adapter's __init__
+    server = CoreasonConnectServiceAsync(config=config, secrets=_BROKEN_SECRETS)
+    server.ensure_plugins_loaded()
 
     # Plugin should NOT be loaded
     assert "rightfind_broken" not in server.plugins
@@ -123,22 +133,11 @@ async def test_plugin_init_failure_missing_secrets() -> None:
 
 
 @pytest.mark.asyncio
-async def test_complex_workflow() -> None:
+async def test_complex_workflow(rightfind_server: CoreasonConnectServiceAsync) -> None:
     """
     Test a simulated complex workflow: Search -> Check Rights -> Purchase.
     """
-    cwd = os.getcwd()
-    adapter_path = os.path.join(cwd, "tests/fixtures/local_libs/adapters/rf_adapter.py")
-    config = AppConfig(
-        plugins=[
-            PluginConfig(
-                id="rightfind",
-                type="local_python",
-                path=adapter_path,
-            )
-        ]
-    )
-    server = CoreasonConnectServiceAsync(config=config, secrets=MockSecrets())
+    server = rightfind_server
 
     # Step 1: Search
     search_res = await server._call_tool_handler("search_literature", {"query": "science"})
@@ -153,3 +152,31 @@ async def test_complex_workflow() -> None:
     # Step 3: Purchase (Spend Gate Trigger)
     purchase_res = await server._call_tool_handler("purchase_article", {"content_id": "10.1000/1"})
     assert "Action suspended" in purchase_res[0].text  # type: ignore[union-attr]
+
+
+@pytest.mark.asyncio
+async def test_override_before_first_use_survives_deferred_load() -> None:
+    """Test that a tool re-registered on a lazy server before first use is not replaced by the plugin's own one."""
+    config = AppConfig(
+        plugins=[
+            PluginConfig(
+                id="rightfind",
+                type="local_python",
+                path=ADAPTER_PATH,
+                description="RightFind Adapter Fixture",
+            )
+        ]
+    )
+    server = CoreasonConnectServiceAsync(config=config, secrets=_MOCK_SECRETS)
+    server.tool_registry["search_literature"] = ToolDefinition(
+        name="search_literature",
+        tool=Tool(name="search_literature", inputSchema={"type": "object"}),
+        is_consequential=True,
+    )
+
+    # The first call triggers the deferred load, which must keep the override in place
+    result = await server._call_tool_handler("search_literature", {"query": "science"})
+
+    assert "Action suspended: Human approval required for search_literature." in result[0].text  # type: ignore[union-attr]
+    assert server.tool_registry["search_literature"].is_consequential
+    assert "rightfind" in server.plugins
@@ -8,87 +8,92 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_connect
 
-import os
 import sys
-from unittest import mock
 
 import pytest
 
 from coreason_connect.secrets import EnvSecretsProvider
 
 
-class TestEnvSecretsProvider:
-    @pytest.fixture
-    def provider(self) -> EnvSecretsProvider:
-        return EnvSecretsProvider()
+@pytest.fixture(scope="module")
+def provider() -> EnvSecretsProvider:
+    """A single provider for the module; it holds no state and reads os.environ on each lookup."""
+    return EnvSecretsProvider()
+
 
-    def test_get_secret_exists(self, provider: EnvSecretsProvider) -> None:
+class TestEnvSecretsProvider:
+    def test_get_secret_exists(self, provider: EnvSecretsProvider, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test retrieving an existing secret."""
-        with mock.patch.dict(os.environ, {"TEST_SECRET": "secret_value"}):
-            assert provider.get_secret("TEST_SECRET") == "secret_value"
+        monkeypatch.setenv("TEST_SECRET", "secret_value")
+        assert provider.get_secret("TEST_SECRET") == "secret_value"
 
-    def test_get_secret_missing(self, provider: EnvSecretsProvider) -> None:
+    def test_get_secret_missing(self, provider: EnvSecretsProvider, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test retrieving a missing secret raises KeyError."""
-        with mock.patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(KeyError, match="Secret 'MISSING_SECRET' not found"):
-                provider.get_secret("MISSING_SECRET")
+        monkeypatch.delenv("MISSING_SECRET", raising=False)
+        with pytest.raises(KeyError, match="Secret 'MISSING_SECRET' not found"):
+            provider.get_secret("MISSING_SECRET")
 
-    def test_get_user_credential_exists(self, provider: EnvSecretsProvider) -> None:
+    def test_get_user_credential_exists(self, provider: EnvSecretsProvider, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test retrieving an existing user credential."""
-        with mock.patch.dict(os.environ, {"TEST_CRED": "cred_value"}):
-            assert provider.get_user_credential("TEST_CRED") == "cred_value"
+        monkeypatch.setenv("TEST_CRED", "cred_value")
+        assert provider.get_user_credential("TEST_CRED") == "cred_value"
 
-    def test_get_user_credential_missing(self, provider: EnvSecretsProvider) -> None:
+    def test_get_user_credential_missing(self, provider: EnvSecretsProvider, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test retrieving a missing user credential raises KeyError."""
-        with mock.patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(KeyError, match="Credential 'MISSING_CRED' not found"):
-                provider.get_user_credential("MISSING_CRED")
+        monkeypatch.delenv("MISSING_CRED", raising=False)
+        with pytest.raises(KeyError, match="Credential 'MISSING_CRED' not found"):
+            provider.get_user_credential("MISSING_CRED")
 
     # Edge Case Tests
 
-    def test_get_secret_empty_string(self, provider: EnvSecretsProvider) -> None:
+    def test_get_secret_empty_string(self, provider: EnvSecretsProvider, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test retrieving a secret set to an empty string."""
-        with mock.patch.dict(os.environ, {"EMPTY_SECRET": ""}):
-            assert provider.get_secret("EMPTY_SECRET") == ""
+        monkeypatch.setenv("EMPTY_SECRET", "")
+        assert provider.get_secret("EMPTY_SECRET") == ""
 
-    def test_get_secret_whitespace(self, provider: EnvSecretsProvider) -> None:
+    def test_get_secret_whitespace(self, provider: EnvSecretsProvider, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test retrieving a secret containing only whitespace."""
-        with mock.patch.dict(os.environ, {"WHITESPACE_SECRET": "   "}):
-            assert provider.get_secret("WHITESPACE_SECRET") == "   "
+        monkeypatch.setenv("WHITESPACE_SECRET", "   ")
+        assert provider.get_secret("WHITESPACE_SECRET") == "   "
 
-    def test_get_secret_special_chars(self, provider: EnvSecretsProvider) -> None:
+    def test_get_secret_special_chars(self, provider: EnvSecretsProvider, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test retrieving a secret with special characters."""
         special_val = "!@#$%^&*()_+-=[]{}|;':,./<>?`~\\"
-        with mock.patch.dict(os.environ, {"SPECIAL_SECRET": special_val}):
-            assert provider.get_secret("SPECIAL_SECRET") == special_val
+        monkeypatch.setenv("SPECIAL_SECRET", special_val)
+        assert provider.get_secret("SPECIAL_SECRET") == special_val
 
-    def test_get_secret_case_sensitivity(self, provider: EnvSecretsProvider) -> None:
+    def test_get_secret_case_sensitivity(self, provider: EnvSecretsProvider, monkeypatch: pytest.MonkeyPatch) -> None:
         """
         Test case sensitivity behavior.
         - POSIX (Linux/macOS): Case-sensitive (uppercase != lowercase).
         - Windows: Case-insensitive (uppercase == lowercase).
         """
-        with mock.patch.dict(os.environ, {"UPPERCASE_KEY": "value"}, clear=True):
-            # Should always find the exact match
-            assert provider.get_secret("UPPERCASE_KEY") == "value"
-
-            if sys.platform == "win32":
-                # On Windows, lowercase lookup should also work
-                assert provider.get_secret("uppercase_key") == "value"
-            else:
-                # On POSIX, lowercase lookup should fail
-                with pytest.raises(KeyError):
-                    provider.get_secret("uppercase_key")
+        # Remove any lowercase variant first; on Windows this would also remove the uppercase key
+        monkeypatch.delenv("uppercase_key", raising=False)
+        monkeypatch.setenv("UPPERCASE_KEY", "value")
+
+        # Should always find the exact match
+        assert provider.get_secret("UPPERCASE_KEY") == "value"
+
+        if sys.platform == "win32":
+            # On Windows, lowercase lookup should also work
+            assert provider.get_secret("uppercase_key") == "value"
+        else:
+            # On POSIX, lowercase lookup should fail
+            with pytest.raises(KeyError):
+                provider.get_secret("uppercase_key")
 
     # Complex Scenario Tests
 
-    def test_get_user_credential_json_string(self, provider: EnvSecretsProvider) -> None:
+    def test_get_user_credential_json_string(
+        self, provider: EnvSecretsProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """
         Test retrieving a complex credential stored as a JSON string.
         The provider should return the raw string as-is without parsing.
         """
         json_val = '{"username": "admin", "password": "super_secret_password!", "meta": {"id": 123}}'
-        with mock.patch.dict(os.environ, {"COMPLEX_CRED": json_val}):
-            result = provider.get_user_credential("COMPLEX_CRED")
-            assert isinstance(result, str)
-            assert result == json_val
+        monkeypatch.setenv("COMPLEX_CRED", json_val)
+        result = provider.get_user_credential("COMPLEX_CRED")
+        assert isinstance(result, str)
+        assert result == json_val
@@ -9,6 +9,7 @@
 # Source Code: https://github.com/CoReason-AI/coreason_connect
 
 import json
+from collections import OrderedDict
 from typing import Any, Optional
 from unittest.mock import MagicMock, patch
 
@@ -16,6 +17,8 @@ import pytest
 from coreason_identity.models import UserContext
 from mcp.types import Tool
 
+import coreason_connect.server as server_module
+from coreason_connect.config import AppConfig
 from coreason_connect.interfaces import ConnectorProtocol, SecretsProvider
 from coreason_connect.server import CoreasonConnectServiceAsync
 from coreason_connect.types import ToolDefinition, ToolExecutionError
@@ -44,6 +47,44 @@ def test_server_initialization(server: CoreasonConnectServiceAsync) -> None:
     assert server.tool_registry == {}
 
 
+@pytest.mark.asyncio
+async def test_plugins_loaded_on_first_use(mock_secrets: SecretsProvider, mock_plugin: MockPlugin) -> None:
+    """Test that plugins are not instantiated until tools are first requested."""
+    with patch("coreason_connect.server.PluginLoader.load_all", return_value={"mock": mock_plugin}) as mock_load:
+        server = CoreasonConnectServiceAsync(secrets=mock_secrets)
+        mock_load.assert_not_called()
+
+        tools = await server._list_tools_handler()
+        await server._list_tools_handler()
+
+    mock_load.assert_called_once()
+    assert "mock" in server.plugins
+    assert sorted(t.name for t in tools) == ["mock_dangerous", "mock_echo"]
+
+
+def test_plugins_loaded_eagerly(mock_secrets: SecretsProvider, mock_plugin: MockPlugin) -> None:
+    """Test that eager_load instantiates plugins during initialization."""
+    with patch("coreason_connect.server.PluginLoader.load_all", return_value={"mock": mock_plugin}) as mock_load:
+        server = CoreasonConnectServiceAsync(config=AppConfig(eager_load=True), secrets=mock_secrets)
+
+    mock_load.assert_called_once()
+    assert "mock_echo" in server.tool_registry
+
+
+@pytest.mark.asyncio
+async def test_list_tools_reflects_registry_changes(mock_secrets: SecretsProvider, mock_plugin: MockPlugin) -> None:
+    """Test that tools registered after the first listing, including on eager servers, are listed."""
+    server = CoreasonConnectServiceAsync(config=AppConfig(eager_load=True), secrets=mock_secrets)
+    assert await server._list_tools_handler() == []
+
+    for tool_def in mock_plugin.get_tools():
+        server.plugin_registry[tool_def.name] = mock_plugin
+        server.tool_registry[tool_def.name] = tool_def
+
+    tools = await server._list_tools_handler()
+    assert sorted(t.name for t in tools) == ["mock_dangerous", "mock_echo"]
+
+
 @pytest.mark.asyncio
 async def test_list_tools_handler_empty(server: CoreasonConnectServiceAsync) -> None:
     """Test listing tools when no plugins are loaded."""
@@ -144,6 +185,22 @@ async def test_load_plugins_exception(server: CoreasonConnectServiceAsync) -> No
         server._load_plugins()
 
 
+@pytest.mark.asyncio
+async def test_failed_deferred_load_is_retried(server: CoreasonConnectServiceAsync, mock_plugin: MockPlugin) -> None:
+    """Test that a deferred load which raised is attempted again on the next use."""
+    server.plugin_loader.load_all = MagicMock(  # type: ignore[method-assign]
+        side_effect=[Exception("Load error"), {"mock": mock_plugin}]
+    )
+
+    with pytest.raises(Exception, match="Load error"):
+        await server._list_tools_handler()
+
+    tools = await server._list_tools_handler()
+
+    assert server.plugin_loader.load_all.call_count == 2
+    assert sorted(t.name for t in tools) == ["mock_dangerous", "mock_echo"]
+
+
 @pytest.mark.asyncio
 async def test_mcp_decorators_usage(server: CoreasonConnectServiceAsync) -> None:
     """Test that MCP decorators are used (coverage check)."""
@@ -350,3 +407,28 @@ async def test_spend_gate_interception_via_mock_plugin(
     assert len(result) == 1
     assert result[0].type == "text"
     assert "Action suspended: Human approval required for mock_dangerous." in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_tool_listing_does_not_requery_plugins(mock_secrets: SecretsProvider, mock_plugin: MockPlugin) -> None:
+    """Test that repeated listings read the registry instead of calling get_tools again."""
+    with patch("coreason_connect.server.PluginLoader.load_all", return_value={"mock": mock_plugin}):
+        server = CoreasonConnectServiceAsync(secrets=mock_secrets)
+        with patch.object(mock_plugin, "get_tools", wraps=mock_plugin.get_tools) as mock_get_tools:
+            first = await server._list_tools_handler()
+            second = await server._list_tools_handler()
+
+    mock_get_tools.assert_called_once()
+    assert first == second
+    assert first is not second
+
+
+def test_encode_result_by_type() -> None:
+    """Test that results are rendered as JSON for containers and str otherwise."""
+    assert server_module._encode_result("plain") == "plain"
+    assert server_module._encode_result(42) == "42"
+    assert server_module._encode_result(None) == "None"
+    assert json.loads(server_module._encode_result([1, 2])) == [1, 2]
+    assert json.loads(server_module._encode_result(OrderedDict(a=1))) == {"a": 1}
+    # Client-visible text keeps the stdlib json.dumps format
+    assert server_module._encode_result({"ok": 1, "\u00e9": "\u00fc"}) == '{"ok": 1, "\\u00e9": "\\u00fc"}'
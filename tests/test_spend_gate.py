@@ -24,7 +24,7 @@ async def test_spend_gate_interception() -> None:
     mock_plugin = MockConsequentialPlugin(server.secrets)
     server.plugins["mock_consequential"] = mock_plugin
 
-    # Register tools manually as _load_plugins is already called in __init__
+    # Register tools manually; the registries are consulted on every call, so no reload is needed
     for tool_def in mock_plugin.get_tools():
         server.plugin_registry[tool_def.name] = mock_plugin
         server.tool_registry[tool_def.name] = tool_def
@@ -40,3 +40,28 @@ async def test_spend_gate_interception() -> None:
     assert len(result_safe) == 1
     assert result_safe[0].type == "text"
     assert "OK" in result_safe[0].text
+
+
+@pytest.mark.asyncio
+async def test_spend_gate_honours_registry_changes_after_first_use() -> None:
+    """Test that tools registered or re-registered after the first call are dispatched from the live registries."""
+    server = CoreasonConnectServiceAsync()
+    mock_plugin = MockConsequentialPlugin(server.secrets)
+
+    # The first lookup triggers plugin loading before anything is registered
+    result_missing = await server._call_tool_handler("safe_tool", {})
+    assert "Error: Tool 'safe_tool' not found." in result_missing[0].text  # type: ignore[union-attr]
+
+    safe_tool = next(t for t in mock_plugin.get_tools() if t.name == "safe_tool")
+    server.plugin_registry["safe_tool"] = mock_plugin
+    server.tool_registry["safe_tool"] = safe_tool
+
+    result_safe = await server._call_tool_handler("safe_tool", {})
+    assert "OK" in result_safe[0].text  # type: ignore[union-attr]
+
+    # Re-registering the tool as consequential must put it behind the spend gate
+    server.tool_registry["safe_tool"] = safe_tool.model_copy(update={"is_consequential": True})
+
+    result_gated = await server._call_tool_handler("safe_tool", {})
+    assert "Action suspended: Human approval required for safe_tool." in result_gated[0].text  # type: ignore[union-attr]
+    assert await server.execute_tool("safe_tool", {}) == "Action suspended: Human approval required for safe_tool."